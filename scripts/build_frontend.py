@@ -1,20 +1,167 @@
 #!/usr/bin/env python3
 from __future__ import annotations
 
+import gzip
+import hashlib
+import os
 import shutil
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 ROOT = Path(__file__).resolve().parent.parent
 FRONTEND_DIR = ROOT / "frontend"
 DIST_DIR = FRONTEND_DIR / "dist"
 STATIC_DIR = ROOT / "src" / "doc_to_benchmark" / "static"
+LOCKFILE = FRONTEND_DIR / "package-lock.json"
+NODE_MODULES_DIR = FRONTEND_DIR / "node_modules"
+NODE_MODULES_HASH = FRONTEND_DIR / ".node_modules.hash"
+NPM_CACHE_DIR = ROOT / ".npm-cache"
+BUILD_STAMP = DIST_DIR / ".build-stamp"
+ASSETS_DIR = DIST_DIR / "assets"
+COMPRESSIBLE_SUFFIXES = {".js", ".css", ".svg", ".json", ".html", ".txt", ".map"}
+SOURCE_PATHS = [
+    FRONTEND_DIR / "src",
+    FRONTEND_DIR / "public",
+    FRONTEND_DIR / "index.html",
+    FRONTEND_DIR / "package.json",
+    LOCKFILE,
+    *FRONTEND_DIR.glob("vite.config.*"),
+    *FRONTEND_DIR.glob("tsconfig*.json"),
+]
 
 
-def run(command: list[str], cwd: Path) -> None:
+def run(command: list[str], cwd: Path, env: dict[str, str] | None = None) -> None:
     print(f"→ {' '.join(command)}", flush=True)
-    subprocess.run(command, cwd=cwd, check=True)
+    subprocess.run(command, cwd=cwd, check=True, env=env)
+
+
+def lockfile_hash() -> str | None:
+    """Return the sha256 of package-lock.json, or None when it is missing."""
+    if not LOCKFILE.exists():
+        return None
+    return hashlib.sha256(LOCKFILE.read_bytes()).hexdigest()
+
+
+def install_dependencies(env: dict[str, str]) -> None:
+    """Install node_modules unless the lockfile is unchanged since the last install."""
+    current = lockfile_hash()
+    if current is None:
+        run(["npm", "install"], FRONTEND_DIR, env)
+        return
+
+    if NODE_MODULES_DIR.exists() and NODE_MODULES_HASH.exists():
+        if NODE_MODULES_HASH.read_text(encoding="utf-8").strip() == current:
+            print("node_modules is up-to-date with package-lock.json; skipping npm ci")
+            return
+
+    run(["npm", "ci", "--prefer-offline", "--no-audit", "--no-fund", "--maxsockets=50"], FRONTEND_DIR, env)
+    NODE_MODULES_HASH.write_text(current, encoding="utf-8")
+
+
+def _iter_files(path: Path):
+    if path.is_file():
+        yield path
+    elif path.is_dir():
+        for root, _, files in os.walk(path):
+            for name in files:
+                yield Path(root) / name
+
+
+def source_signature() -> str:
+    """Return the newest mtime (ns) among the frontend sources as a string."""
+    newest = 0
+    for source in SOURCE_PATHS:
+        for file in _iter_files(source):
+            newest = max(newest, file.stat().st_mtime_ns)
+    return str(newest)
+
+
+def dist_is_fresh(signature: str) -> bool:
+    """Check whether DIST_DIR was built from sources matching *signature*."""
+    if not (DIST_DIR / "index.html").exists():
+        return False
+    if BUILD_STAMP.exists():
+        return BUILD_STAMP.read_text(encoding="utf-8").strip() == signature
+
+    dist_files = [file for file in _iter_files(DIST_DIR) if file != BUILD_STAMP]
+    if not dist_files:
+        return False
+    oldest = min(file.stat().st_mtime_ns for file in dist_files)
+    return oldest > int(signature)
+
+
+def static_is_current() -> bool:
+    """Check whether STATIC_DIR already holds the current dist bundle."""
+    static_index = STATIC_DIR / "index.html"
+    dist_index = DIST_DIR / "index.html"
+    if not static_index.exists():
+        return False
+    return static_index.stat().st_mtime_ns >= dist_index.stat().st_mtime_ns
+
+
+def precompress_assets() -> None:
+    """Write a .gz sibling next to each compressible asset so the server never compresses on request."""
+    for file in _iter_files(ASSETS_DIR):
+        if file.suffix not in COMPRESSIBLE_SUFFIXES:
+            continue
+        target = file.with_name(f"{file.name}.gz")
+        source_stat = file.stat()
+        if target.exists() and target.stat().st_mtime_ns == source_stat.st_mtime_ns:
+            continue
+        data = file.read_bytes()
+        target.write_bytes(gzip.compress(data, compresslevel=9, mtime=0))
+        os.utime(target, ns=(source_stat.st_atime_ns, source_stat.st_mtime_ns))
+
+
+def _link_or_copy(source: Path, target: Path) -> None:
+    """Replace *target* with a hardlink to *source*, copying across devices."""
+    staging = target.with_name(f"{target.name}.tmp")
+    if staging.exists():
+        staging.unlink()
+    try:
+        os.link(source, staging)
+    except OSError:
+        shutil.copy2(source, staging)
+    os.replace(staging, target)
+
+
+def sync_tree(source: Path, destination: Path) -> None:
+    """Mirror *source* into *destination*, touching only files that changed."""
+    expected: set[Path] = set()
+    for root, _, files in os.walk(source):
+        relative_root = Path(root).relative_to(source)
+        target_root = destination / relative_root
+        target_root.mkdir(parents=True, exist_ok=True)
+        expected.add(relative_root)
+        for name in files:
+            source_file = Path(root) / name
+            if source_file == BUILD_STAMP:
+                continue
+            expected.add(relative_root / name)
+            target_file = target_root / name
+            source_stat = source_file.stat()
+            try:
+                target_stat = target_file.stat()
+            except FileNotFoundError:
+                target_stat = None
+            if (
+                target_stat is not None
+                and target_stat.st_size == source_stat.st_size
+                and target_stat.st_mtime_ns == source_stat.st_mtime_ns
+            ):
+                continue
+            _link_or_copy(source_file, target_file)
+
+    for root, dirs, files in os.walk(destination, topdown=False):
+        relative_root = Path(root).relative_to(destination)
+        for name in files:
+            if relative_root / name not in expected:
+                (Path(root) / name).unlink()
+        for name in dirs:
+            if relative_root / name not in expected:
+                (Path(root) / name).rmdir()
 
 
 def main() -> int:
@@ -22,13 +169,29 @@ def main() -> int:
         print("Frontend directory does not exist. Run the Vite scaffold first.", file=sys.stderr)
         return 1
 
-    run(["npm", "install"], FRONTEND_DIR)
-    run(["npm", "run", "build"], FRONTEND_DIR)
+    env = os.environ.copy()
+    env["npm_config_cache"] = str(NPM_CACHE_DIR)
+
+    # npm ci is network-bound; hash the sources and prepare STATIC_DIR meanwhile.
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        install = pool.submit(install_dependencies, env)
+        pending_signature = pool.submit(source_signature)
+        STATIC_DIR.parent.mkdir(parents=True, exist_ok=True)
+        install.result()
+        signature = pending_signature.result()
+
+    if dist_is_fresh(signature):
+        print(f"{DIST_DIR} is newer than the frontend sources; skipping npm run build")
+        if static_is_current():
+            return 0
+    else:
+        run(["npm", "run", "build"], FRONTEND_DIR, env)
+        BUILD_STAMP.write_text(signature, encoding="utf-8")
+
+    precompress_assets()
 
-    if STATIC_DIR.exists():
-        shutil.rmtree(STATIC_DIR)
-    shutil.copytree(DIST_DIR, STATIC_DIR)
-    print(f"Copied {DIST_DIR} → {STATIC_DIR}")
+    sync_tree(DIST_DIR, STATIC_DIR)
+    print(f"Synced {DIST_DIR} → {STATIC_DIR}")
     return 0
 
 
@@ -46,11 +46,9 @@ setup(
         "opencv-python-headless>=4.8",
         "Pillow>=10.0",
         "PyMuPDF>=1.24.0",
-        "PyPDF2>=3.0.0",
         "langgraph>=0.6.0",
         "pdfplumber>=0.11.0",
         "pdfminer.six>=20231206",
-        "pypdf>=4.0.0",
         "pypdfium2>=4.30.0",
         "requests>=2.31.0",
         "python-dotenv>=1.0.0",
@@ -66,6 +64,9 @@ setup(
         "openai>=1.42.1",
         "sse-starlette>=3.0.2",
     ],
+    extras_require={
+        "speedups": ["orjson>=3.9"],
+    },
     python_requires=">=3.10",
     entry_points={
         "console_scripts": [
@@ -1,4 +1,4 @@
 from .routes import router
-from .dependencies import get_session, get_storage
+from .dependencies import get_session, get_storage, wait_until_ready
 
-__all__ = ["router", "get_storage", "get_session"]
+__all__ = ["router", "get_storage", "get_session", "wait_until_ready"]
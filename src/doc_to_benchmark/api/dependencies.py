@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from collections.abc import AsyncGenerator
 
-from fastapi import Request
+from fastapi import HTTPException, Request, status
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
 from ..storage import UploadStorage
@@ -12,7 +12,15 @@ def get_storage(request: Request) -> UploadStorage:
     return request.app.state.storage  # type: ignore[attr-defined]
 
 
+async def wait_until_ready(request: Request) -> None:
+    """Block until background startup (storage and database init) has finished."""
+    await request.app.state.ready.wait()  # type: ignore[attr-defined]
+    if request.app.state.startup_error is not None:  # type: ignore[attr-defined]
+        raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail="서버 초기화에 실패했습니다.")
+
+
 async def get_session(request: Request) -> AsyncGenerator[AsyncSession, None]:
+    await wait_until_ready(request)
     session_factory: async_sessionmaker[AsyncSession] = request.app.state.db_sessionmaker  # type: ignore[attr-defined]
     async with session_factory() as session:
         yield session
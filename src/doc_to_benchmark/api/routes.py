@@ -1,11 +1,13 @@
 from __future__ import annotations
 
-from typing import List
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Iterable, Iterator, List
 
 from fastapi import APIRouter, Depends, File, HTTPException, Request, Response, UploadFile, status
 from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import aliased, raiseload, selectinload
 
 import os
 from pathlib import Path
@@ -16,6 +18,7 @@ from ..models import (
     Document,
     DocumentPage,
     DocumentStatus,
+    PageOcrResult,
     ReportAgentStatus,
 )
 from ..schemas import (
@@ -38,20 +41,22 @@ from ..services.worker import OcrTask
 from .dependencies import get_session, get_storage
 
 from anyio import to_thread
-from PyPDF2 import PdfReader
+import pypdfium2 as pdfium
+import pypdfium2.raw as pdfium_c
 
 def _count_pdf_pages_sync(path: str) -> int:
-    with open(path, "rb") as f:
-        reader = PdfReader(f)
-        if reader.is_encrypted:
-            # 빈 비번 시도(일부 파일은 비번 없이 해제됨). 그래도 잠겨 있으면 거절
-            try:
-                reader.decrypt("")
-            except Exception:
-                pass
-            if reader.is_encrypted:
-                raise HTTPException(status_code=400, detail="비밀번호로 잠긴 PDF는 지원하지 않습니다.")
-        return len(reader.pages)
+    # pdfium은 페이지 트리만 읽어 개수를 세므로 PyPDF2처럼 전체 객체를 파싱하지 않음
+    # (빈 비번으로 열리는 파일은 그대로 열림). 비밀번호가 필요하면 거절
+    try:
+        pdf = pdfium.PdfDocument(path)
+    except pdfium.PdfiumError as exc:
+        if getattr(exc, "err_code", None) == pdfium_c.FPDF_ERR_PASSWORD:
+            raise HTTPException(status_code=400, detail="비밀번호로 잠긴 PDF는 지원하지 않습니다.") from exc
+        raise
+    try:
+        return len(pdf)
+    finally:
+        pdf.close()
 
 router = APIRouter()
 
@@ -68,6 +73,8 @@ _PROVIDER_DISPLAY_NAMES = {
 }
 
 
+# 제공자 이름 종류는 몇 개 되지 않으므로 페이지×제공자마다 다시 포맷하지 않도록 캐시
+@lru_cache(maxsize=256)
 def _provider_display_name(provider: str | None) -> str:
     if not provider:
         return "-"
@@ -114,115 +121,190 @@ def _build_document_summary(
     )
 
 
-def _aggregate_provider_metrics(document: Document) -> dict[str, dict[str, object]]:
-    stats: dict[str, dict[str, object]] = {}
-    for result in document.page_provider_results:
-        provider = (result.provider or "").strip()
+def _page_provider_results(document: Document) -> Iterator[PageOcrResult]:
+    # (쪽 번호, 제공자명) 순서로 순회. 제공자 dict 순서(평가 목록 순서, 추천 동점 처리)가
+    # 이 순서를 따르므로 Document.page_provider_results 및 SQL 집계와 같은 순서를 유지해야 함
+    for page in document.pages:
+        yield from page.provider_results
+
+
+@dataclass(slots=True)
+class _ProviderMetrics:
+    """Per-provider averages plus the (min, max) of each across providers, from one pass."""
+
+    providers: dict[str, dict[str, object]]
+    quality_range: tuple[float, float] | None = None
+    time_range: tuple[float, float] | None = None
+    cost_range: tuple[float, float] | None = None
+
+    def add(self, provider: str, value: dict[str, object]) -> None:
+        self.providers[provider] = value
+        self.quality_range = _widen_range(self.quality_range, value["average_score"])
+        self.time_range = _widen_range(self.time_range, value["average_time"])
+        self.cost_range = _widen_range(self.cost_range, value["total_cost"])
+
+
+def _widen_range(current: tuple[float, float] | None, value: object) -> tuple[float, float] | None:
+    if value is None:
+        return current
+    if current is None:
+        return (value, value)  # type: ignore[return-value]
+    low, high = current
+    return (min(low, value), max(high, value))  # type: ignore[type-var]
+
+
+@dataclass(slots=True)
+class _ProviderTotals:
+    """Running sums for one provider; no per-row lists are kept."""
+
+    score_sum: float = 0.0
+    score_count: int = 0
+    time_sum: float = 0.0
+    time_count: int = 0
+    cost_sum: float = 0.0
+    cost_count: int = 0
+    pages: set[int] = field(default_factory=set)
+    remark_page: int | None = None
+    remark: str | None = None
+
+
+def _aggregate_provider_metrics(results: Iterable[PageOcrResult]) -> _ProviderMetrics:
+    stats: dict[str, _ProviderTotals] = {}
+    for result in results:
+        # 제공자명은 저장 시 이미 공백이 제거됨 (ocr_pipeline._replace_page_results) - SQL 집계와 같은 원본 값 비교
+        provider = result.provider or ""
         if not provider:
             continue
-        entry = stats.setdefault(
+        totals = stats.get(provider)
+        if totals is None:
+            totals = stats[provider] = _ProviderTotals()
+        if result.llm_judge_score is not None:
+            totals.score_sum += result.llm_judge_score
+            totals.score_count += 1
+        if result.processing_time_ms is not None:
+            totals.time_sum += result.processing_time_ms
+            totals.time_count += 1
+        if result.cost_per_page is not None:
+            totals.cost_sum += float(result.cost_per_page)
+            totals.cost_count += 1
+        totals.pages.add(result.page_number)
+        # 쪽 번호가 가장 앞선 비고를 대표로 사용 (같은 쪽이면 먼저 나온 것)
+        if result.remarks and (totals.remark_page is None or result.page_number < totals.remark_page):
+            totals.remark_page = result.page_number
+            totals.remark = result.remarks
+
+    metrics = _ProviderMetrics(providers={})
+    for provider, totals in stats.items():
+        metrics.add(
             provider,
             {
-                "scores": [],
-                "times": [],
-                "costs": [],
-                "total_cost": 0.0,
-                "pages": set(),
-                "remarks": [],
+                "average_score": (totals.score_sum / totals.score_count) if totals.score_count else None,
+                "average_time": (totals.time_sum / totals.time_count) if totals.time_count else None,
+                "average_cost": (totals.cost_sum / totals.cost_count) if totals.cost_count else None,
+                "total_cost": totals.cost_sum if totals.cost_count else None,
+                "pages_count": len(totals.pages),
+                "representative_remark": totals.remark,
             },
         )
-        if result.llm_judge_score is not None:
-            entry["scores"].append(result.llm_judge_score)
-        if result.processing_time_ms is not None:
-            entry["times"].append(result.processing_time_ms)
-        if result.cost_per_page is not None:
-            entry["costs"].append(result.cost_per_page)
-            entry["total_cost"] = float(entry.get("total_cost", 0.0)) + float(result.cost_per_page)
-        entry["pages"].add(result.page_number)
-        if result.remarks:
-            entry["remarks"].append((result.page_number, result.remarks))
-
-    aggregated: dict[str, dict[str, object]] = {}
-    for provider, entry in stats.items():
-        scores: list[float] = entry["scores"]  # type: ignore[assignment]
-        times: list[float] = entry["times"]  # type: ignore[assignment]
-        costs: list[float] = entry["costs"]  # type: ignore[assignment]
-        remarks: list[tuple[int, str]] = entry["remarks"]  # type: ignore[assignment]
-        aggregated[provider] = {
-            "average_score": (sum(scores) / len(scores)) if scores else None,
-            "average_time": (sum(times) / len(times)) if times else None,
-            "average_cost": (sum(costs) / len(costs)) if costs else None,
-            "total_cost": entry.get("total_cost") if costs else None,
-            "pages_count": len(entry["pages"]),  # type: ignore[arg-type]
-            "representative_remark": next(
-                (remark for _, remark in sorted(remarks, key=lambda item: item[0]) if remark),
-                None,
-            )
-            if remarks
-            else None,
-        }
-    return aggregated
+    return metrics
+
+
+async def _query_provider_metrics(session: AsyncSession, document_id: str) -> _ProviderMetrics:
+    """Database-side counterpart of :func:`_aggregate_provider_metrics`.
+
+    Providers are trimmed when they are written, so both aggregations group on the raw column.
+    """
+    provider = PageOcrResult.provider
+    remark_source = aliased(PageOcrResult)
+    # 쪽 번호가 가장 앞선 비어 있지 않은 비고를 대표 비고로 사용
+    representative_remark = (
+        select(remark_source.remarks)
+        .where(
+            remark_source.document_id == document_id,
+            remark_source.provider == provider,
+            remark_source.remarks != "",
+        )
+        .order_by(remark_source.page_number, remark_source.id)
+        .limit(1)
+        .scalar_subquery()
+    )
+    result = await session.execute(
+        select(
+            provider,
+            func.avg(PageOcrResult.llm_judge_score),
+            func.avg(PageOcrResult.processing_time_ms),
+            func.avg(PageOcrResult.cost_per_page),
+            func.sum(PageOcrResult.cost_per_page),
+            func.count(func.distinct(PageOcrResult.page_number)),
+            representative_remark,
+        )
+        .where(PageOcrResult.document_id == document_id, provider != "")
+        .group_by(provider)
+        # 파이썬 집계와 같은 순서(처음 등장한 쪽 번호, 제공자명)로 정렬
+        .order_by(func.min(PageOcrResult.page_number), provider)
+    )
+
+    metrics = _ProviderMetrics(providers={})
+    for name, average_score, average_time, average_cost, total_cost, pages_count, remark in result:
+        metrics.add(
+            name,
+            {
+                "average_score": average_score,
+                "average_time": average_time,
+                "average_cost": average_cost,
+                "total_cost": total_cost,
+                "pages_count": pages_count,
+                "representative_remark": remark,
+            },
+        )
+    return metrics
 
 
 def _calculate_recommendation(
     document: Document,
-    metrics: dict[str, dict[str, object]] | None = None,
+    metrics: _ProviderMetrics | None = None,
 ) -> tuple[str | None, str | None]:
     if document.recommended_strategy and document.recommendation_notes:
         return document.recommended_strategy, document.recommendation_notes
 
-    metrics = metrics or _aggregate_provider_metrics(document)
-    if not metrics:
+    if metrics is None:
+        metrics = _aggregate_provider_metrics(document.page_provider_results)
+    providers = metrics.providers
+    if not providers:
         return document.recommended_strategy, document.recommendation_notes
 
-    quality_values = [
-        value["average_score"]
-        for value in metrics.values()
-        if value.get("average_score") is not None
-    ]
-    time_values = [
-        value["average_time"]
-        for value in metrics.values()
-        if value.get("average_time") is not None
-    ]
-    cost_values = [
-        value["total_cost"]
-        for value in metrics.values()
-        if value.get("total_cost") is not None
-    ]
-
-    q_min = min(quality_values) if quality_values else 0.0
-    q_max = max(quality_values) if quality_values else 0.0
-    t_min = min(time_values) if time_values else 0.0
-    t_max = max(time_values) if time_values else 0.0
-    c_min = min(cost_values) if cost_values else 0.0
-    c_max = max(cost_values) if cost_values else 0.0
+    has_quality = metrics.quality_range is not None
+    has_time = metrics.time_range is not None
+    has_cost = metrics.cost_range is not None
+    q_min, q_max = metrics.quality_range or (0.0, 0.0)
+    t_min, t_max = metrics.time_range or (0.0, 0.0)
+    c_min, c_max = metrics.cost_range or (0.0, 0.0)
 
     best_provider: str | None = None
     best_score = float("-inf")
-    for provider, value in metrics.items():
+    for provider, value in providers.items():
         score = float(value.get("average_score") or 0.0)
         time_ms = float(value.get("average_time") or 0.0)
         total_cost = float(value.get("total_cost") or 0.0)
 
-        if quality_values and q_max != q_min:
+        if has_quality and q_max != q_min:
             quality_component = (score - q_min) / (q_max - q_min)
-        elif quality_values:
+        elif has_quality:
             quality_component = 1.0
         else:
             quality_component = 0.0
 
-        if time_values and t_max != t_min:
+        if has_time and t_max != t_min:
             base_time = time_ms if value.get("average_time") is not None else t_max
             time_component = (t_max - base_time) / (t_max - t_min)
-        elif time_values:
+        elif has_time:
             time_component = 1.0
         else:
             time_component = 0.0
 
-        if cost_values and c_max != c_min:
+        if has_cost and c_max != c_min:
             cost_component = (c_max - total_cost) / (c_max - c_min)
-        elif cost_values:
+        elif has_cost:
             cost_component = 1.0
         else:
             cost_component = 0.0
@@ -233,9 +315,9 @@ def _calculate_recommendation(
             best_provider = provider
 
     if best_provider is None:
-        best_provider = next(iter(metrics))
+        best_provider = next(iter(providers))
 
-    stats = metrics[best_provider]
+    stats = providers[best_provider]
     reason_parts: list[str] = []
     if stats.get("average_score") is not None:
         reason_parts.append(f"LLM-Judge 점수 {stats['average_score']:.1f}")
@@ -255,34 +337,20 @@ def _calculate_recommendation(
 
 def _build_provider_evaluations(
     document: Document,
-    metrics: dict[str, dict[str, object]] | None = None,
+    metrics: _ProviderMetrics | None = None,
 ) -> List[ProviderEvaluationOut]:
-    metrics = metrics or _aggregate_provider_metrics(document)
-    if not metrics:
+    if metrics is None:
+        metrics = _aggregate_provider_metrics(document.page_provider_results)
+    if not metrics.providers:
         return []
 
     total_pages = document.pages_count or len(document.pages) or 1
-    quality_values = [
-        value["average_score"]
-        for value in metrics.values()
-        if value.get("average_score") is not None
-    ]
-    time_values = [
-        value["average_time"]
-        for value in metrics.values()
-        if value.get("average_time") is not None
-    ]
-    cost_totals = [
-        value["total_cost"]
-        for value in metrics.values()
-        if value.get("total_cost") is not None
-    ]
-    max_quality = max(quality_values) if quality_values else None
-    min_time = min(time_values) if time_values else None
-    min_cost = min(cost_totals) if cost_totals else None
+    max_quality = metrics.quality_range[1] if metrics.quality_range else None
+    min_time = metrics.time_range[0] if metrics.time_range else None
+    min_cost = metrics.cost_range[0] if metrics.cost_range else None
 
     response: List[ProviderEvaluationOut] = []
-    for provider, value in metrics.items():
+    for provider, value in metrics.providers.items():
         score_raw = value.get("average_score")
         time_raw = value.get("average_time")
         cost_raw = value.get("average_cost")
@@ -334,41 +402,61 @@ def _coerce_validity(value: str | None) -> str | bool | None:
 
 
 def _build_page_previews(document: Document) -> List[PagePreviewOut]:
+    # ORM에서 온 값은 이미 스키마 타입과 일치하므로 검증 없이 model_construct로 생성
+    # (응답 전체는 FastAPI가 response_model로 한 번 더 검증)
+    construct_result = PageProviderResultOut.model_construct
+    display_name = _provider_display_name
     previews: List[PagePreviewOut] = []
     for page in document.pages:
-        provider_results: List[PageProviderResultOut] = []
-        for result in getattr(page, "provider_results", []) or []:
-            provider_results.append(
-                PageProviderResultOut(
-                    provider=result.provider,
-                    display_name=_provider_display_name(result.provider),
-                    text_content=result.text_content or page.text_content,
-                    validity=_coerce_validity(result.validity),
-                    llm_judge_score=result.llm_judge_score,
-                    processing_time_ms=result.processing_time_ms,
-                    cost_per_page=result.cost_per_page,
-                    remarks=result.remarks,
-                )
+        page_text = page.text_content
+        provider_results = [
+            construct_result(
+                provider=result.provider,
+                display_name=display_name(result.provider),
+                text_content=result.text_content or page_text,
+                validity=_coerce_validity(result.validity),
+                llm_judge_score=result.llm_judge_score,
+                processing_time_ms=result.processing_time_ms,
+                cost_per_page=result.cost_per_page,
+                remarks=result.remarks,
             )
+            for result in page.provider_results
+        ]
 
         previews.append(
-            PagePreviewOut(
+            PagePreviewOut.model_construct(
                 page_number=page.page_number,
                 image_path=page.image_path,
-                text_content=page.text_content,
+                text_content=page_text,
                 provider_results=provider_results or None,
             )
         )
     return previews
 
 
+@router.get("/health")
+async def health(request: Request, response: Response) -> dict[str, str]:
+    state = request.app.state  # type: ignore[attr-defined]
+    if not state.ready.is_set():
+        response.status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+        return {"status": "starting"}
+    if state.startup_error is not None:
+        response.status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+        return {"status": "error"}
+    return {"status": "ok"}
+
+
 @router.get("/documents", response_model=DocumentListResponse)
 async def list_documents(session: AsyncSession = Depends(get_session)) -> DocumentListResponse:
-    stmt = (
-        select(Document, func.count(AnalysisItem.id).label("analysis_items_count"))
-        .outerjoin(AnalysisItem, AnalysisItem.document_id == Document.id)
-        .group_by(Document.id)
-        .order_by(Document.uploaded_at.desc())
+    # 문서별 분석 항목 수는 상관 서브쿼리로 계산 (JOIN/GROUP BY 없이 eager 로딩과도 조합 가능)
+    analysis_items_count = (
+        select(func.count(AnalysisItem.id))
+        .where(AnalysisItem.document_id == Document.id)
+        .correlate(Document)
+        .scalar_subquery()
+    )
+    stmt = select(Document, analysis_items_count.label("analysis_items_count")).order_by(
+        Document.uploaded_at.desc()
     )
     result = await session.execute(stmt)
     items: List[DocumentSummary] = []
@@ -419,13 +507,15 @@ async def get_document_insights(
             selectinload(Document.analysis_items),
             selectinload(Document.pages).selectinload(DocumentPage.provider_results),
             selectinload(Document.report_agent_statuses),
-            selectinload(Document.page_provider_results),
+            # 위에서 지정하지 않은 관계를 건드리면 지연 로딩 대신 즉시 오류 (N+1 방지)
+            raiseload("*"),
         ],
     )
     if document is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="문서를 찾을 수 없습니다.")
 
-    metrics = _aggregate_provider_metrics(document)
+    # 페이지별 결과와 문서 전체 결과는 같은 행이므로 이미 로드한 pages에서 집계
+    metrics = _aggregate_provider_metrics(_page_provider_results(document))
     recommended, reason = _calculate_recommendation(document, metrics)
 
     summary = _build_document_summary(
@@ -465,13 +555,17 @@ async def update_document_selection(
     document = await session.get(
         Document,
         document_id,
-        options=[selectinload(Document.analysis_items), selectinload(Document.page_provider_results)],
+        options=[
+            selectinload(Document.analysis_items),
+            raiseload("*"),
+        ],
     )
     if document is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="문서를 찾을 수 없습니다.")
 
-    metrics = _aggregate_provider_metrics(document)
-    if payload.provider not in metrics:
+    # 제공자별 평균은 결과 행을 불러오지 않고 DB에서 GROUP BY로 집계
+    metrics = await _query_provider_metrics(session, document_id)
+    if payload.provider not in metrics.providers:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="선택한 제공자가 문서 평가 데이터에 존재하지 않습니다.",
@@ -75,6 +75,28 @@ def _ensure_sqlite_schema(sync_connection) -> None:
     if "cost_per_page" not in page_ocr_columns:
         sync_connection.execute(text("ALTER TABLE page_ocr_results ADD COLUMN cost_per_page FLOAT"))
 
+    # 에이전트 상태 upsert용 유니크 인덱스 (중복 행은 최신 것만 남김)
+    agent_constraints = {item["name"] for item in inspector.get_unique_constraints("report_agent_statuses")}
+    agent_constraints |= {item["name"] for item in inspector.get_indexes("report_agent_statuses")}
+    if "uix_document_agent" not in agent_constraints:
+        sync_connection.execute(
+            text(
+                "DELETE FROM report_agent_statuses WHERE id NOT IN "
+                "(SELECT MAX(id) FROM report_agent_statuses GROUP BY document_id, agent_name)"
+            )
+        )
+        sync_connection.execute(
+            text(
+                "CREATE UNIQUE INDEX uix_document_agent "
+                "ON report_agent_statuses (document_id, agent_name)"
+            )
+        )
+
+    # 문서 목록의 분석 항목 수 서브쿼리용 인덱스
+    sync_connection.execute(
+        text("CREATE INDEX IF NOT EXISTS ix_analysis_items_document_id ON analysis_items (document_id)")
+    )
+
 
 async def initialize_database(engine: AsyncEngine) -> None:
     """Create tables and apply SQLite-compatible schema upgrades."""
@@ -4,35 +4,122 @@ from pathlib import Path
 
 import asyncio
 import contextlib
+import logging
+import mimetypes
+import stat
+import sys
 from typing import Optional
 
-from anyio import create_memory_object_stream
+from anyio import create_memory_object_stream, to_thread
 from anyio.streams.memory import MemoryObjectReceiveStream, MemoryObjectSendStream
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, Response
 from fastapi.staticfiles import StaticFiles
+from starlette.datastructures import Headers
+from starlette.exceptions import HTTPException
+from starlette.staticfiles import NotModifiedResponse
 
 from .api import router
 from .database import build_database_url, create_engine, create_sessionmaker, initialize_database
+from .ocr_agent.agents.basic_extraction_agent import shutdown_local_tool_pool, warm_local_tool_pool
 from .storage import UploadStorage
 from .services.events import SseBroker
 from .services.worker import OcrBackgroundWorker, OcrTask
 
 STATIC_DIR = Path(__file__).parent / "static"
 
+logger = logging.getLogger(__name__)
+
+
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+PRECOMPRESSED_ENCODINGS = (("br", ".br"), ("gzip", ".gz"))
+
+
+def _encoding_qualities(header: str) -> dict[str, float]:
+    """Parse Accept-Encoding into {coding: q}; codings without a q value get 1.0."""
+    qualities: dict[str, float] = {}
+    for item in header.split(","):
+        coding, _, params = item.partition(";")
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        quality = 1.0
+        for param in params.split(";"):
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        qualities[coding] = quality
+    return qualities
+
+
+def _accepts_encoding(qualities: dict[str, float], encoding: str) -> bool:
+    # An explicit entry wins over "*", so "gzip;q=0, *" still refuses gzip.
+    return qualities.get(encoding, qualities.get("*", 0.0)) > 0
+
 
 class SPAStaticFiles(StaticFiles):
     """Serve the React build and fall back to index.html for history navigation."""
 
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self._index_path = Path(self.directory) / "index.html"
+        self._index_exists = self._index_path.is_file()
+
     async def get_response(self, path: str, scope):  # type: ignore[override]
-        response = await super().get_response(path, scope)
-        if response.status_code == 404:
-            index_path = Path(self.directory) / "index.html"
-            if index_path.exists():
-                return FileResponse(index_path)
+        if path.startswith("assets/"):
+            # Vite fingerprints everything under assets/, so the content never changes.
+            precompressed = await self._precompressed_response(path, scope)
+            response = precompressed or await self._get_or_fallback(path, scope)
+            # The index.html fallback for a missing asset keeps its own no-cache header.
+            if response.status_code in (200, 304) and "cache-control" not in response.headers:
+                response.headers["Cache-Control"] = IMMUTABLE_CACHE_CONTROL
+            return response
+        return await self._get_or_fallback(path, scope)
+
+    async def _get_or_fallback(self, path: str, scope) -> Response:
+        try:
+            response = await super().get_response(path, scope)
+        except HTTPException as exc:
+            if exc.status_code != 404:
+                raise
+            response = None
+        if response is None or response.status_code == 404:
+            if self._index_exists:
+                return FileResponse(self._index_path, headers={"Cache-Control": "no-cache"})
+            raise HTTPException(status_code=404)
         return response
 
+    async def _precompressed_response(self, path: str, scope) -> Optional[Response]:
+        """Return a .br/.gz sibling produced at build time when the client accepts it."""
+        if scope["method"] not in ("GET", "HEAD"):
+            # Let StaticFiles reject the method as it does for every other path.
+            return None
+        request_headers = Headers(scope=scope)
+        qualities = _encoding_qualities(request_headers.get("accept-encoding", ""))
+        for encoding, suffix in PRECOMPRESSED_ENCODINGS:
+            if not _accepts_encoding(qualities, encoding):
+                continue
+            full_path, stat_result = await to_thread.run_sync(self.lookup_path, path + suffix)
+            if stat_result is None or not stat.S_ISREG(stat_result.st_mode):
+                continue
+            media_type = mimetypes.guess_type(path)[0] or "application/octet-stream"
+            response = FileResponse(
+                full_path,
+                stat_result=stat_result,
+                media_type=media_type,
+                headers={"Content-Encoding": encoding, "Vary": "Accept-Encoding"},
+            )
+            # Same conditional handling as StaticFiles.file_response, which cannot set the
+            # original media type and Content-Encoding itself.
+            if self.is_not_modified(response.headers, request_headers):
+                return NotModifiedResponse(response.headers)
+            return response
+        return None
+
 
 def create_app() -> FastAPI:
     app = FastAPI(title="PyPI Upload Demo", version="0.1.4")
@@ -60,11 +147,20 @@ def create_app() -> FastAPI:
     app.state.ocr_task_sender = task_sender
     app.state._ocr_task_receiver = task_receiver
     app.state._ocr_worker_task: Optional[asyncio.Task[None]] = None
-
-    @app.on_event("startup")
-    async def _startup() -> None:
-        await storage.ensure_ready()
-        await initialize_database(engine)
+    app.state._bootstrap_task: Optional[asyncio.Task[None]] = None
+    app.state.ready = asyncio.Event()
+    app.state.startup_error: Optional[BaseException] = None
+
+    async def _bootstrap() -> None:
+        try:
+            await storage.ensure_ready()
+            await initialize_database(engine)
+        except Exception as exc:  # noqa: BLE001
+            app.state.startup_error = exc
+            app.state.ready.set()
+            # Nobody awaits this task, so log here rather than re-raise into the void.
+            logger.exception("Application startup failed")
+            return
 
         worker = OcrBackgroundWorker(
             tasks=app.state._ocr_task_receiver,
@@ -73,14 +169,36 @@ def create_app() -> FastAPI:
             broker=app.state.sse_broker,
         )
         app.state._ocr_worker_task = asyncio.create_task(worker.run())
+        app.state.ready.set()
+
+        # Spawn the local PDF parser processes now so the first document skips their startup.
+        try:
+            await to_thread.run_sync(warm_local_tool_pool)
+        except Exception:  # noqa: BLE001
+            # The app is already serving; parsers still start on first use.
+            logger.exception("Local PDF parser pool warm-up failed")
+
+    @app.on_event("startup")
+    async def _startup() -> None:
+        # Bind immediately; DB-backed routes wait on app.state.ready instead.
+        app.state._bootstrap_task = asyncio.create_task(_bootstrap())
 
     @app.on_event("shutdown")
     async def _shutdown() -> None:
+        if app.state._bootstrap_task and not app.state._bootstrap_task.done():
+            app.state._bootstrap_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await app.state._bootstrap_task
         if app.state._ocr_worker_task:
             app.state._ocr_worker_task.cancel()
             with contextlib.suppress(asyncio.CancelledError):
                 await app.state._ocr_worker_task
         await app.state.ocr_task_sender.aclose()
+        await to_thread.run_sync(shutdown_local_tool_pool)
+        # The split tool (and its render pool) is imported lazily; skip loading cv2/fitz just to stop it.
+        split_tool = sys.modules.get(f"{__package__}.ocr_agent.tools.custom_split_tool")
+        if split_tool is not None:
+            await to_thread.run_sync(split_tool.shutdown_render_pool)
         await engine.dispose()
 
     app.include_router(router, prefix="/api", tags=["documents"])
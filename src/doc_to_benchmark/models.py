@@ -50,7 +50,7 @@ class Document(Base):
     page_provider_results: Mapped[list["PageOcrResult"]] = relationship(
         back_populates="document",
         cascade="all, delete-orphan",
-        order_by="PageOcrResult.page_number",
+        order_by="(PageOcrResult.page_number, PageOcrResult.provider)",
     )
     report_agent_statuses: Mapped[list["ReportAgentStatus"]] = relationship(
         back_populates="document", cascade="all, delete-orphan"
@@ -80,7 +80,7 @@ class AnalysisItem(Base):
     __tablename__ = "analysis_items"
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
-    document_id: Mapped[str] = mapped_column(ForeignKey("documents.id", ondelete="CASCADE"))
+    document_id: Mapped[str] = mapped_column(ForeignKey("documents.id", ondelete="CASCADE"), index=True)
     question: Mapped[str] = mapped_column(Text)
     answer: Mapped[str] = mapped_column(Text)
     context_type: Mapped[str] = mapped_column(String(64), default="paragraph")
@@ -121,6 +121,7 @@ class AgentStatus(str, enum.Enum):
 
 class ReportAgentStatus(Base):
     __tablename__ = "report_agent_statuses"
+    __table_args__ = (UniqueConstraint("document_id", "agent_name", name="uix_document_agent"),)
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     document_id: Mapped[str] = mapped_column(ForeignKey("documents.id", ondelete="CASCADE"))
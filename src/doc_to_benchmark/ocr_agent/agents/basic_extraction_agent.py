@@ -3,20 +3,170 @@
 다중 라이브러리로 원본 텍스트 추출
 """
 
+import os
 import time
 import json
-import random
+import zlib
+import importlib
+import multiprocessing
+import threading
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
-from typing import List, Union, Any, Optional
-from datetime import datetime
+from typing import Dict, List, Union, Any, Optional
+from datetime import datetime, timezone
+
+import numpy as np
 
 from ..state import DocumentState, ExtractionResult, PageExtractionResult, add_extraction_result
 from .. import config
-from ..tools.pdfplumber_tool import PDFPlumberTool
-from ..tools.pdfminer_tool import PDFMinerTool
-from ..tools.pypdfium2_tool import PyPDFium2Tool
-from ..tools.upstage_ocr_tool import UpstageOCRTool
-from ..tools.upstage_document_parse_tool import UpstageDocumentParseTool
+
+try:
+    import orjson
+except ImportError:  # orjson 미설치 시 표준 json 사용
+    orjson = None
+
+
+# 도구 이름 → (모듈 경로, 클래스 이름). 실제 import/생성은 처음 사용할 때 수행
+EXTRACTION_TOOLS = {
+    "pdfplumber": ("..tools.pdfplumber_tool", "PDFPlumberTool"),
+    "pdfminer": ("..tools.pdfminer_tool", "PDFMinerTool"),
+    "pypdfium2": ("..tools.pypdfium2_tool", "PyPDFium2Tool"),
+    "upstage_ocr": ("..tools.upstage_ocr_tool", "UpstageOCRTool"),
+    "upstage_document_parse": ("..tools.upstage_document_parse_tool", "UpstageDocumentParseTool"),
+}
+
+
+# GIL을 오래 잡는 로컬 파서 (프로세스 풀에서 실행)
+LOCAL_TOOLS = frozenset({"pdfplumber", "pdfminer", "pypdfium2"})
+
+# writev 한 번에 넘길 수 있는 최대 버퍼 수 (Linux/macOS IOV_MAX)
+_IOV_MAX = 1024
+
+_local_tool_pool: Optional[ProcessPoolExecutor] = None
+_local_tool_pool_lock = threading.Lock()
+
+
+def get_local_tool_pool() -> Optional[ProcessPoolExecutor]:
+    """로컬 파서용 프로세스 풀 반환 (처음 호출 시 생성, 비활성화 시 None)"""
+    global _local_tool_pool
+    if config.LOCAL_TOOL_PROCESSES <= 0:
+        return None
+    with _local_tool_pool_lock:
+        if _local_tool_pool is None:
+            # forkserver는 무거운 모듈을 매번 다시 fork하지 않음 (미지원 플랫폼은 spawn)
+            method = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+            _local_tool_pool = ProcessPoolExecutor(
+                max_workers=config.LOCAL_TOOL_PROCESSES,
+                mp_context=multiprocessing.get_context(method),
+            )
+        return _local_tool_pool
+
+
+def warm_local_tool_pool() -> None:
+    """프로세스 풀의 워커를 미리 띄워 첫 문서의 기동 지연을 없앰"""
+    pool = get_local_tool_pool()
+    if pool is None:
+        return
+    # 도구마다 워커 수만큼 제출해 모든 워커가 기동되고 각 워커의 도구 인스턴스가 채워지도록 함
+    futures = [
+        (tool_name, pool.submit(_warm_worker, tool_name))
+        for tool_name in LOCAL_TOOLS
+        for _ in range(config.LOCAL_TOOL_PROCESSES)
+    ]
+    failed: set = set()
+    for tool_name, future in futures:
+        try:
+            future.result()
+        except Exception as e:
+            # 워밍업 실패는 치명적이지 않음 (실제 작업 시 다시 시도), 도구별로 한 번만 경고
+            if tool_name not in failed:
+                failed.add(tool_name)
+                print(f"[WARN] {tool_name} process pool warm-up failed: {e}")
+
+
+def shutdown_local_tool_pool() -> None:
+    """프로세스 풀 종료"""
+    global _local_tool_pool
+    with _local_tool_pool_lock:
+        if _local_tool_pool is not None:
+            _local_tool_pool.shutdown(cancel_futures=True)
+            _local_tool_pool = None
+
+
+def _import_tool(tool_name: str) -> Any:
+    """도구 클래스를 import하여 인스턴스 생성"""
+    module_path, class_name = EXTRACTION_TOOLS[tool_name]
+    module = importlib.import_module(module_path, __package__)
+    return getattr(module, class_name)()
+
+
+_process_tools: Dict[str, Any] = {}
+
+
+def _warm_worker(tool_name: str) -> None:
+    """프로세스 풀 워커에서 도구 인스턴스를 미리 생성 (인스턴스는 부모로 보내지 않음)"""
+    if tool_name not in _process_tools:
+        _process_tools[tool_name] = _import_tool(tool_name)
+
+
+def _run_local_tool(
+    tool_name: str,
+    document_path: str,
+    page_numbers: Optional[List[int]]
+) -> Dict[str, Any]:
+    """프로세스 풀 워커에서 로컬 도구 실행 (도구 인스턴스는 워커별로 재사용)"""
+    tool = _process_tools.get(tool_name)
+    if tool is None:
+        tool = _process_tools[tool_name] = _import_tool(tool_name)
+    if page_numbers is None:
+        return tool.extract(Path(document_path))
+    return tool.extract(Path(document_path), page_numbers=page_numbers)
+
+
+def _encode_jsonl_line(data: Dict[str, Any]) -> bytes:
+    """JSONL 한 줄을 UTF-8 바이트로 직렬화"""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_APPEND_NEWLINE | orjson.OPT_NON_STR_KEYS)
+    return (json.dumps(data, ensure_ascii=False) + "\n").encode("utf-8")
+
+
+def _format_timestamp_ns(timestamp_ns: int) -> str:
+    """time.time_ns() 값을 ISO 8601 (UTC) 문자열로 변환 (직렬화 시점에만 호출)"""
+    return datetime.fromtimestamp(timestamp_ns / 1e9, tz=timezone.utc).isoformat()
+
+
+def _encode_json_document(data: Dict[str, Any]) -> bytes:
+    """들여쓰기된 JSON 문서를 UTF-8 바이트로 직렬화 (timestamp_ns는 ISO timestamp로 함께 기록)"""
+    if "timestamp_ns" in data:
+        data = {**data, "timestamp": _format_timestamp_ns(data["timestamp_ns"])}
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, ensure_ascii=False, indent=2).encode("utf-8")
+
+
+def _write_chunks(path: Path, chunks: List[bytes]) -> None:
+    """바이트 조각들을 중간 결합 없이 파일에 기록 (가능하면 writev 한 번으로)"""
+    if not hasattr(os, "writev"):
+        # Windows 등 writev 미지원 플랫폼
+        with open(path, 'wb') as f:
+            f.writelines(chunks)
+        return
+    
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        pending = [memoryview(chunk) for chunk in chunks if chunk]
+        while pending:
+            written = os.writev(fd, pending[:_IOV_MAX])
+            # 부분 기록 시 남은 조각부터 다시 기록
+            while written and pending:
+                if written >= len(pending[0]):
+                    written -= len(pending.pop(0))
+                else:
+                    pending[0] = pending[0][written:]
+                    written = 0
+    finally:
+        os.close(fd)
 
 
 class BasicExtractionAgent:
@@ -36,17 +186,46 @@ class BasicExtractionAgent:
     - 각 도구별 조합 생성 → 2단계에서 검증
     """
     
-    def __init__(self):
-        self.tools = {
-            "pdfplumber": PDFPlumberTool(),
-            "pdfminer": PDFMinerTool(),
-            "pypdfium2": PyPDFium2Tool(),
-            "upstage_ocr": UpstageOCRTool(),
-            "upstage_document_parse": UpstageDocumentParseTool()
-        }
+    def __init__(self, executor: Optional[Executor] = None):
+        self.tools = dict(EXTRACTION_TOOLS)
+        self._tool_cache: Dict[str, Any] = {}
+        self._executor = executor  # 로컬 도구 실행기 (None이면 공용 프로세스 풀)
+    
+    def _get_tool(self, tool_name: str) -> Any:
+        """도구 인스턴스 반환 (처음 호출 시 모듈 import 및 생성)"""
+        tool = self._tool_cache.get(tool_name)
+        if tool is None:
+            tool = self._tool_cache[tool_name] = _import_tool(tool_name)
+        return tool
     
-    def run(self, state: DocumentState) -> DocumentState:
-        """기본 추출 실행 (다중 라이브러리)"""
+    def _run_extract(
+        self,
+        tool_name: str,
+        tool: Any,
+        document_path: Path,
+        page_numbers: Optional[List[int]],
+        api_key: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """도구 추출 실행 (로컬 파서는 프로세스 풀로 보내 GIL 경합을 피함)"""
+        if tool_name in LOCAL_TOOLS:
+            executor = self._executor or get_local_tool_pool()
+            if executor is not None:
+                try:
+                    return executor.submit(_run_local_tool, tool_name, str(document_path), page_numbers).result()
+                except BrokenProcessPool as e:
+                    print(f"[WARN] {tool_name} process pool unavailable, running in-thread: {e}")
+        kwargs: Dict[str, Any] = {} if page_numbers is None else {"page_numbers": page_numbers}
+        if api_key is not None:
+            kwargs["api_key"] = api_key
+        return tool.extract(document_path, **kwargs)
+    
+    def run(self, state: DocumentState, api_key: Optional[str] = None) -> DocumentState:
+        """
+        기본 추출 실행 (다중 라이브러리)
+        
+        api_key는 실행별로 전달되는 Upstage API 키 (에이전트/도구 인스턴스는 여러 문서가
+        공유하므로 키를 인스턴스에 저장하지 않음). 없으면 upstage 도구는 건너뜀.
+        """
         
         document_path = state["document_path"]
         document_name = state["document_name"]
@@ -55,17 +234,49 @@ class BasicExtractionAgent:
         print(f"[EXTRACTION] Document: {document_name}")
         print(f"{'='*60}\n")
         
-        # 모든 라이브러리로 추출
-        for idx, (tool_name, tool) in enumerate(self.tools.items(), 1):
-            print(f"[{idx}/{len(self.tools)}] {tool_name} extraction starting...")
-            
-            result = self._extract_with_tool(
-                tool_name, 
-                tool, 
-                document_path, 
-                document_name
-            )
+        # 도구 준비 (import 실패한 도구는 제외)
+        tools: Dict[str, Any] = {}
+        for tool_name in self.tools:
+            try:
+                tools[tool_name] = self._get_tool(tool_name)
+            except ImportError as e:
+                print(f"[WARN] {tool_name} unavailable: {e}")
+        
+        # 페이지 샘플링 (모든 도구가 같은 페이지를 추출하도록 문서당 한 번만 수행)
+        total_pages = self._count_pages(document_path)
+        sampled_pages = self._sample_pages(total_pages, max_samples=5, document_name=document_name) if total_pages else None
+        if sampled_pages is not None:
+            print(f"[SAMPLING] Selected {len(sampled_pages)} pages from {total_pages} total: {sampled_pages}")
+        
+        # 도구별 출력 디렉터리를 한 번에 준비 (확장자 대소문자/중복과 무관하게 stem 사용)
+        doc_stem = Path(document_name).stem
+        output_dirs = self._prepare_output_dirs(config.EXTRACTED_DIR / doc_stem, list(tools))
+        
+        # 모든 라이브러리로 동시 추출 (API 도구는 네트워크 대기, 로컬 도구는 C 확장에서 GIL 해제)
+        results: Dict[str, Optional[ExtractionResult]] = {}
+        with ThreadPoolExecutor(max_workers=max(1, min(len(tools), config.EXTRACTION_MAX_WORKERS))) as executor:
+            futures = {}
+            for idx, (tool_name, tool) in enumerate(tools.items(), 1):
+                print(f"[{idx}/{len(tools)}] {tool_name} extraction starting...")
+                future = executor.submit(
+                    self._extract_with_tool,
+                    tool_name,
+                    tool,
+                    document_path,
+                    document_name,
+                    output_dirs[tool_name],
+                    total_pages,
+                    sampled_pages,
+                    api_key
+                )
+                futures[future] = tool_name
             
+            for future in as_completed(futures):
+                results[futures[future]] = future.result()
+        
+        # 도구 순서대로 상태에 반영 (결정적 순서 유지)
+        for tool_name in tools:
+            result = results.get(tool_name)
             if result:
                 state = add_extraction_result(state, result)
                 print(f"[OK] {tool_name} completed: {result.page_count} pages, {result.processing_time_ms:.0f}ms")
@@ -77,7 +288,7 @@ class BasicExtractionAgent:
             "document_name": document_name,
             "document_path": document_path,
             "extraction_count": len(state["extraction_results"]),
-            "timestamp": datetime.now().isoformat()
+            "timestamp_ns": time.time_ns()
         }
         
         print(f"\n[SUMMARY] Extraction completed: {len(state['extraction_results'])} libraries")
@@ -87,14 +298,60 @@ class BasicExtractionAgent:
         
         return state
     
-    def _sample_pages(self, total_pages: int, max_samples: int = 5) -> List[int]:
-        """페이지 샘플링 (랜덤, 최대 5개)"""
+    def _prepare_output_dirs(self, doc_root: Path, tool_names: List[str]) -> Dict[str, Path]:
+        """문서 루트와 도구별 하위 디렉터리를 생성 (이미 있는 디렉터리는 건너뜀)"""
+        os.makedirs(doc_root, exist_ok=True)
+        with os.scandir(doc_root) as entries:
+            existing = {entry.name for entry in entries if entry.is_dir()}
+        
+        output_dirs = {}
+        for tool_name in tool_names:
+            if tool_name not in existing:
+                os.mkdir(doc_root / tool_name)
+            output_dirs[tool_name] = doc_root / tool_name
+        return output_dirs
+    
+    def _count_pages(self, document_path: Union[str, Path]) -> Optional[int]:
+        """전체 파싱 없이 페이지 수 확인 (확인 불가 시 None)"""
+        from ..tools.pypdfium2_tool import count_pdf_pages
+        return count_pdf_pages(document_path)
+    
+    def _sample_pages(self, total_pages: int, max_samples: int = 5, document_name: str = "") -> List[int]:
+        """
+        페이지 샘플링 (랜덤, 최대 5개)
+        
+        문서 이름으로 시드를 고정하여 같은 문서는 실행마다 같은 페이지를 선택한다.
+        """
         if total_pages <= max_samples:
             # 전체 페이지가 5개 이하면 모두 사용
             return list(range(1, total_pages + 1))
         else:
-            # 랜덤하게 5페이지 선택
-            return sorted(random.sample(range(1, total_pages + 1), max_samples))
+            # 문서별 고정 시드로 5페이지 선택
+            rng = np.random.default_rng(zlib.crc32(document_name.encode("utf-8")))
+            picked = rng.choice(total_pages, size=max_samples, replace=False)
+            return sorted(int(page_index) + 1 for page_index in picked)
+    
+    def _make_page_result(
+        self,
+        tool_name: str,
+        page_num: int,
+        page_data: Dict[str, Any],
+        processing_time_ms: float
+    ) -> PageExtractionResult:
+        """도구의 페이지 딕셔너리를 PageExtractionResult로 변환"""
+        return PageExtractionResult(
+            page_num=page_num,
+            strategy=tool_name,
+            text=page_data["text"],
+            bbox=page_data.get("bbox", []),
+            tables=page_data.get("tables", []),
+            processing_time_ms=processing_time_ms,
+            status="success",
+            metadata={
+                "width": page_data.get("width", 0),
+                "height": page_data.get("height", 0)
+            }
+        )
     
     def _calculate_extraction_cost(self, tool_name: str, page_count: int) -> float:
         """
@@ -115,78 +372,74 @@ class BasicExtractionAgent:
         tool_name: str,
         tool: Any, 
         document_path: Union[str, Path], 
-        document_name: str
+        document_name: str,
+        output_dir: Path,
+        total_pages: Optional[int] = None,
+        sampled_pages: Optional[List[int]] = None,
+        api_key: Optional[str] = None
     ) -> ExtractionResult:
-        """범용 도구로 텍스트 추출 (페이지 샘플링)"""
+        """
+        범용 도구로 텍스트 추출 (페이지 샘플링)
+        
+        sampled_pages가 주어지면 도구가 해당 페이지만 추출하고,
+        없으면 전체를 추출한 뒤 샘플링한다.
+        """
         
         # Path 객체로 변환 (한글 경로 처리)
         if not isinstance(document_path, Path):
             document_path = Path(document_path)
         
-        start_time = time.time()
-        
         try:
             if tool_name.startswith("upstage"):
-                api_key = config.get_api_key()
                 if not api_key:
                     print("[WARN] Upstage API Key 미설정으로 upstage 도구를 건너뜁니다.")
                     return None
-                setattr(tool, "api_key", api_key)
+            else:
+                api_key = None  # 로컬 도구에는 키를 넘기지 않음
 
-            # 전체 추출 실행 (페이지 수 확인용)
-            result = tool.extract(document_path)
-            total_pages = len(result["pages"])
-            
-            # 페이지 샘플링
-            sampled_pages = self._sample_pages(total_pages, max_samples=5)
-            print(f"[SAMPLING] Selected {len(sampled_pages)} pages from {total_pages} total: {sampled_pages}")
-            
-            # 전체 처리 시간 측정
-            processing_time = (time.time() - start_time) * 1000  # ms
-            
-            # API 비용 계산
-            api_cost = self._calculate_extraction_cost(tool_name, len(sampled_pages))
-            
-            # 샘플링된 페이지만 추출 (페이지당 평균 시간 계산)
-            page_results = []
-            avg_time_per_page = processing_time / len(sampled_pages) if sampled_pages else 0.0
+            # 처리 시간 측정 (추출 호출 구간만, 단조 증가 ns 타이머)
+            start_ns = time.perf_counter_ns()
+            if sampled_pages is not None:
+                # 샘플링된 페이지만 추출
+                result = self._run_extract(tool_name, tool, document_path, sampled_pages, api_key)
+                processing_time = (time.perf_counter_ns() - start_ns) / 1e6  # ms
+            else:
+                # 페이지 수를 미리 알 수 없으면 전체 추출 후 샘플링
+                result = self._run_extract(tool_name, tool, document_path, None, api_key)
+                processing_time = (time.perf_counter_ns() - start_ns) / 1e6  # ms
+                total_pages = len(result["pages"])
+                sampled_pages = self._sample_pages(total_pages, max_samples=5, document_name=document_name)
+                print(f"[SAMPLING] {tool_name}: selected {len(sampled_pages)} pages from {total_pages} total: {sampled_pages}")
             
-            for page_data in result["pages"]:
-                page_num = page_data["page"]
-                if page_num in sampled_pages:
-                    page_result = PageExtractionResult(
-                        page_num=page_num,
-                        strategy=tool_name,
-                        text=page_data["text"],
-                        bbox=page_data.get("bbox", []),
-                        tables=page_data.get("tables", []),
-                        processing_time_ms=avg_time_per_page,
-                        status="success",
-                        metadata={
-                            "width": page_data.get("width", 0),
-                            "height": page_data.get("height", 0)
-                        }
-                    )
-                    page_results.append(page_result)
+            # API 비용 계산 (실제로 처리된 페이지 기준)
+            extracted_page_count = len(result["pages"])
+            api_cost = self._calculate_extraction_cost(tool_name, extracted_page_count)
             
-            # 결과 저장
-            output_dir = config.EXTRACTED_DIR / document_name.replace('.pdf', '') / tool_name
-            output_dir.mkdir(parents=True, exist_ok=True)
+            # 페이지당 평균 시간: 실제로 추출한 페이지 수로 나눔 (전체 추출 시 전체 페이지 수)
+            avg_time_per_page = processing_time / extracted_page_count if extracted_page_count else 0.0
+            pages_by_num = {page_data["page"]: page_data for page_data in result["pages"]}
+            page_results = [
+                self._make_page_result(tool_name, page_num, pages_by_num[page_num], avg_time_per_page)
+                for page_num in sampled_pages
+                if page_num in pages_by_num
+            ]
             
+            # 결과 저장 (output_dir은 run에서 미리 생성됨)
             pages_text_path = output_dir / "pages_text_sampled.jsonl"
             doc_meta_path = output_dir / "doc_meta.json"
             
-            # pages_text_sampled.jsonl 저장 (샘플링된 페이지만)
-            with open(pages_text_path, 'w', encoding='utf-8') as f:
-                for page_result in page_results:
-                    page_dict = {
-                        "page": page_result.page_num,
-                        "source": page_result.strategy,
-                        "text": page_result.text,
-                        "bbox": page_result.bbox,
-                        "tables": page_result.tables
-                    }
-                    f.write(json.dumps(page_dict, ensure_ascii=False) + '\n')
+            # pages_text_sampled.jsonl 저장 (샘플링된 페이지만, 한 번에 기록)
+            chunks = [
+                _encode_jsonl_line({
+                    "page": page_result.page_num,
+                    "source": page_result.strategy,
+                    "text": page_result.text,
+                    "bbox": page_result.bbox,
+                    "tables": page_result.tables
+                })
+                for page_result in page_results
+            ]
+            _write_chunks(pages_text_path, chunks)
             
             # doc_meta.json 저장
             meta = {
@@ -197,10 +450,10 @@ class BasicExtractionAgent:
                 "sampled_page_count": len(sampled_pages),
                 "sampled_pages": sampled_pages,
                 "processing_time_ms": processing_time,
-                "timestamp": datetime.now().isoformat()
+                "timestamp_ns": time.time_ns()
             }
-            with open(doc_meta_path, 'w', encoding='utf-8') as f:
-                json.dump(meta, f, ensure_ascii=False, indent=2)
+            with open(doc_meta_path, 'wb') as f:
+                f.write(_encode_json_document(meta))
             
             return ExtractionResult(
                 strategy=tool_name,
@@ -31,8 +31,8 @@ class JudgeAgent:
     def __init__(self):
         self.llm_client = SolarClient()
     
-    def run(self, state: DocumentState) -> DocumentState:
-        """LLM Judge 실행 (페이지별)"""
+    def run(self, state: DocumentState, api_key: Optional[str] = None) -> DocumentState:
+        """LLM Judge 실행 (페이지별, api_key는 실행별 Solar API 키)"""
         
         print(f"\n{'='*60}")
         print(f"[JUDGE] Starting LLM Judge evaluation (page-by-page)")
@@ -63,7 +63,7 @@ class JudgeAgent:
             for page_val in validation.page_validations:
                 if page_val.passed:  # Pass된 페이지만 LLM Judge
                     print(f"  Page {page_val.page_num}...", end=" ")
-                    page_judge = self._judge_page(page_val, validation, state)
+                    page_judge = self._judge_page(page_val, validation, state, api_key)
                     if page_judge:
                         page_judges.append(page_judge)
                         print(f"S_total={page_judge.S_total:.2f}")
@@ -100,7 +100,8 @@ class JudgeAgent:
         self,
         page_validation: PageValidationResult,
         validation: ValidationResult,
-        state: DocumentState
+        state: DocumentState,
+        api_key: Optional[str] = None
     ) -> Optional[PageJudgeResult]:
         """개별 페이지 Judge 평가"""
         
@@ -132,7 +133,7 @@ class JudgeAgent:
             )
             
             # LLM 호출
-            response = self.llm_client.call(prompt)
+            response = self.llm_client.call(prompt, api_key=api_key)
             
             if not response:
                 return None
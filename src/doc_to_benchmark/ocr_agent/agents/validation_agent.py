@@ -3,8 +3,11 @@
 Solar LLM이 텍스트 추출 결과의 Pass/Fail 판정 및 자동 폴백 반복 (페이지 단위)
 """
 
+import sys
 import time
-from typing import Dict, List, Optional
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple
 from datetime import datetime
 from itertools import combinations
 
@@ -62,8 +65,8 @@ class ValidationAgent:
             print(f"[WARNING] Some tools failed to initialize: {e}")
             self.tools = {}
     
-    def run(self, state: DocumentState) -> DocumentState:
-        """유효성 검증 실행 (페이지별 + 폴백 통합)"""
+    def run(self, state: DocumentState, api_key: Optional[str] = None) -> DocumentState:
+        """유효성 검증 실행 (페이지별 + 폴백 통합, api_key는 실행별 Solar API 키)"""
         
         print(f"\n{'='*60}")
         print(f"[VALIDATION] Starting validation with page-level fallback")
@@ -71,6 +74,9 @@ class ValidationAgent:
         
         extraction_results = state["extraction_results"]
         
+        # 모든 전략/페이지의 초기 검증을 한 번에 동시 요청 (페이지 간 의존성 없음)
+        initial_validations = self._prevalidate_pages(extraction_results, api_key)
+        
         for idx, extraction in enumerate(extraction_results, 1):
             if extraction.status != "success":
                 print(f"[SKIP] [{idx}/{len(extraction_results)}] {extraction.strategy} - extraction failed")
@@ -86,7 +92,9 @@ class ValidationAgent:
                 
                 # 페이지 검증 (폴백 포함)
                 page_validation = self._validate_page_with_fallback(
-                    page_result, extraction, state
+                    page_result, extraction, state,
+                    initial_validation=initial_validations.get((extraction.strategy, page_result.page_num)),
+                    api_key=api_key
                 )
                 
                 if page_validation:
@@ -127,11 +135,40 @@ class ValidationAgent:
         
         return state
     
+    def _prevalidate_pages(
+        self,
+        extraction_results: List[ExtractionResult],
+        api_key: Optional[str] = None
+    ) -> Dict[Tuple[str, int], Optional[PageValidationResult]]:
+        """성공한 추출 결과의 모든 페이지를 동시에 초기 검증 (LLM 왕복 지연을 겹쳐서 처리)"""
+        
+        jobs = [
+            (extraction, page_result)
+            for extraction in extraction_results
+            if extraction.status == "success"
+            for page_result in extraction.page_results
+        ]
+        if not jobs:
+            return {}
+        
+        print(f"[LLM] Validating {len(jobs)} pages concurrently (max {config.LLM_MAX_CONCURRENCY})")
+        with ThreadPoolExecutor(max_workers=min(len(jobs), config.LLM_MAX_CONCURRENCY)) as executor:
+            results = executor.map(
+                lambda job: self._validate_page(job[1], job[0], api_key),
+                jobs
+            )
+            return {
+                (extraction.strategy, page_result.page_num): result
+                for (extraction, page_result), result in zip(jobs, results)
+            }
+    
     def _validate_page_with_fallback(
         self,
         page_result: PageExtractionResult,
         extraction: ExtractionResult,
-        state: DocumentState
+        state: DocumentState,
+        initial_validation: Optional[PageValidationResult] = None,
+        api_key: Optional[str] = None
     ) -> Optional[PageValidationResult]:
         """
         개별 페이지 검증 + 실패 시 폴백 시도
@@ -146,9 +183,9 @@ class ValidationAgent:
         7. 모두 Fail → 최종 Fail 반환
         """
         
-        # 1. 초기 검증
+        # 1. 초기 검증 (미리 수행된 결과가 있으면 재사용)
         print(f"    Initial validation...", end=" ")
-        page_validation = self._validate_page(page_result, extraction)
+        page_validation = initial_validation or self._validate_page(page_result, extraction, api_key)
         
         if not page_validation:
             return None
@@ -185,7 +222,8 @@ class ValidationAgent:
                 improved_page,
                 extraction,
                 previous_validation=best_validation,
-                fallback_tools=tool_combo
+                fallback_tools=tool_combo,
+                api_key=api_key
             )
             
             if not new_validation:
@@ -219,7 +257,8 @@ class ValidationAgent:
     def _validate_page(
         self,
         page_result: PageExtractionResult,
-        extraction: ExtractionResult
+        extraction: ExtractionResult,
+        api_key: Optional[str] = None
     ) -> Optional[PageValidationResult]:
         """개별 페이지 검증 (Solar LLM 기반)"""
         
@@ -259,7 +298,7 @@ class ValidationAgent:
             
             # Solar LLM 호출
             print(f"      [LLM] Calling Solar for validation...", end=" ")
-            response = self.llm_client.call(prompt)
+            response = self.llm_client.call(prompt, api_key=api_key)
             
             if not response:
                 print("[ERROR]")
@@ -310,8 +349,7 @@ class ValidationAgent:
             
         except Exception as e:
             print(f"[ERROR] Page validation error: {str(e)}")
-            import traceback
-            traceback.print_exc()
+            traceback.print_exception(type(e), e, e.__traceback__, file=sys.stderr)
             return None
     
     def _apply_custom_split_and_reextract(
@@ -355,11 +393,11 @@ class ValidationAgent:
             
             # 1단계 도구로 재추출
             if page_result.strategy == "pdfplumber":
-                from ..tools.pdfplumber_tool import PDFPlumberTool
-                extraction_tool = PDFPlumberTool()
+                from ..tools.pdfplumber_tool import get_pdfplumber_tool
+                extraction_tool = get_pdfplumber_tool()
             elif page_result.strategy == "pdfminer":
-                from ..tools.pdfminer_tool import PDFMinerTool
-                extraction_tool = PDFMinerTool()
+                from ..tools.pdfminer_tool import get_pdfminer_tool
+                extraction_tool = get_pdfminer_tool()
             elif page_result.strategy == "pypdfium2":
                 from ..tools.pypdfium2_tool import PyPDFium2Tool
                 extraction_tool = PyPDFium2Tool()
@@ -407,8 +445,7 @@ class ValidationAgent:
             
         except Exception as e:
             print(f"      [ERROR] Custom split and re-extract failed: {e}")
-            import traceback
-            traceback.print_exc()
+            traceback.print_exception(type(e), e, e.__traceback__, file=sys.stderr)
             return None
     
     def _generate_tool_combinations(
@@ -557,11 +594,12 @@ class ValidationAgent:
         improved_page: PageExtractionResult,
         extraction: ExtractionResult,
         previous_validation: PageValidationResult,
-        fallback_tools: List[str]
+        fallback_tools: List[str],
+        api_key: Optional[str] = None
     ) -> Optional[PageValidationResult]:
         """도구 적용 후 재검증"""
         
-        new_validation = self._validate_page(improved_page, extraction)
+        new_validation = self._validate_page(improved_page, extraction, api_key)
         
         if new_validation:
             # 폴백 정보 업데이트
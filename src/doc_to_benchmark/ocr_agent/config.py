@@ -69,6 +69,7 @@ UPSTAGE_API_PRICING = {
 # pdfplumber
 PDF_PLUMBER_LAYOUT_WIDTH_TOLERANCE = 3
 PDF_PLUMBER_LAYOUT_HEIGHT_TOLERANCE = 3
+PDF_PLUMBER_MMAP_THRESHOLD = 50 * 1024 * 1024  # 이 크기 이상의 PDF는 mmap으로 열기
 
 # Custom Split (LR-Split) 설정
 CUSTOM_SPLIT_AXIS = "vertical"  # vertical: 좌/우 분할
@@ -77,6 +78,8 @@ CUSTOM_SPLIT_MARGIN_LEFT = 50
 CUSTOM_SPLIT_MARGIN_RIGHT = 50
 CUSTOM_SPLIT_DPI = 300
 CUSTOM_SPLIT_MIDLINE_DETECTION = "auto"  # auto or fixed
+CUSTOM_SPLIT_RENDER_PROCESSES = min(4, os.cpu_count() or 1)  # 공용 렌더링 프로세스 풀 크기 (1 이하면 순차 렌더링)
+CUSTOM_SPLIT_PARALLEL_MIN_PAGES = 8  # 이 페이지 수 이상일 때만 프로세스 풀로 렌더링
 
 # 유효성 검증 임계치 (1.0=Pass, 0.0=Fail 방식)
 VALIDATION_THRESHOLDS = {
@@ -124,11 +127,19 @@ LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
 # 멀티프로세싱 설정
 MAX_WORKERS = 4  # 병렬 처리 워커 수
 BATCH_SIZE = 10  # 배치 처리 크기
+EXTRACTION_MAX_WORKERS = 5  # 1단계 추출 도구 동시 실행 수
+LOCAL_TOOL_PROCESSES = 3  # 로컬 PDF 파서 전용 프로세스 풀 크기 (0이면 스레드에서 직접 실행)
 
 # 타임아웃 설정 (초)
 OCR_TIMEOUT = 300         # OCR 처리 타임아웃
 VALIDATION_TIMEOUT = 60   # 검증 타임아웃
 LLM_TIMEOUT = 120         # LLM 호출 타임아웃
+LLM_MAX_CONCURRENCY = 8   # 동시에 보낼 LLM 요청 수 (API rate limit 고려)
+
+# LLM 응답 캐시 (동일 프롬프트 재처리 시 API 재호출 생략)
+LLM_CACHE_ENABLED = True
+LLM_CACHE_PATH = Path.home() / ".cache" / "doc_to_benchmark" / "llm_cache.sqlite3"
+LLM_CACHE_TTL_SECONDS = 30 * 24 * 60 * 60  # 30일
 
 # 디버그 모드
 DEBUG_MODE = False
@@ -182,18 +193,5 @@ def set_project_root(
     return PROJECT_ROOT
 
 
-def set_api_key(value: Optional[str]) -> None:
-    """외부에서 전달된 API 키를 설정."""
-
-    global SOLAR_API_KEY
-    SOLAR_API_KEY = value
-
-
-def get_api_key() -> Optional[str]:
-    """현재 설정된 API 키 반환."""
-
-    return SOLAR_API_KEY
-
-
 if __name__ == "__main__":
     create_directories()
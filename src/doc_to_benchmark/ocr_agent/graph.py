@@ -3,7 +3,9 @@ LangGraph 그래프 정의
 멀티 에이전트 워크플로우 구성
 """
 
+from functools import lru_cache
 from typing import Any, Callable, Dict, List, Optional
+from langchain_core.runnables import RunnableConfig
 from langgraph.graph import StateGraph, END
 from .state import DocumentState, update_stage
 from . import config
@@ -15,17 +17,40 @@ class DocumentProcessingGraph:
     def __init__(self, progress_callback: Optional[Callable[..., None]] = None):
         self.graph = StateGraph(DocumentState)
         self._progress_callback = progress_callback
+        # 에이전트는 문서별 상태를 갖지 않으므로 (상태는 DocumentState로 전달) 한 번만 생성해 재사용
+        self._agents: Dict[str, Any] = {}
         self._build_graph()
 
-    def _emit(self, event: str, stage: str, description: Optional[str] = None) -> None:
-        if self._progress_callback is None:
+    def _get_agent(self, name: str, factory: Callable[[], Any]) -> Any:
+        """노드별 에이전트 인스턴스를 최초 호출 시 생성하고 이후에는 재사용"""
+        agent = self._agents.get(name)
+        if agent is None:
+            agent = self._agents[name] = factory()
+        return agent
+
+    def _emit(
+        self,
+        config: Optional[RunnableConfig],
+        event: str,
+        stage: str,
+        description: Optional[str] = None,
+    ) -> None:
+        # 실행별 콜백(config["configurable"]["progress_callback"])이 생성자 콜백보다 우선
+        configurable = (config or {}).get("configurable", {})
+        callback = configurable.get("progress_callback") or self._progress_callback
+        if callback is None:
             return
         try:
-            self._progress_callback(event, stage, description=description)
+            callback(event, stage, description=description)
         except TypeError:
             # Backwards compatibility if callback expects only (event, stage)
-            self._progress_callback(event, stage)
+            callback(event, stage)
     
+    @staticmethod
+    def _api_key(config: Optional[RunnableConfig]) -> Optional[str]:
+        # 실행별 API 키(config["configurable"]["api_key"]); 그래프/에이전트는 여러 문서가 공유하므로 전역에 두지 않음
+        return (config or {}).get("configurable", {}).get("api_key")
+
     def _build_graph(self):
         """그래프 노드 및 엣지 구성"""
         
@@ -76,19 +101,20 @@ class DocumentProcessingGraph:
     
     # ========== 노드 함수 ==========
     
-    def basic_extraction_node(self, state: DocumentState) -> DocumentState:
+    def basic_extraction_node(self, state: DocumentState, config: RunnableConfig) -> DocumentState:
         """1단계: 기본 추출 노드"""
         from .agents.basic_extraction_agent import BasicExtractionAgent
 
         print(f"[1단계] 기본 추출 시작: {state['document_name']}")
-        self._emit("stage_started", "extraction")
+        self._emit(config, "stage_started", "extraction")
 
         try:
-            agent = BasicExtractionAgent()
-            state = agent.run(state)
+            agent = self._get_agent("basic_extraction", BasicExtractionAgent)
+            state = agent.run(state, api_key=self._api_key(config))
             state = update_stage(state, "validation")
             print(f"[OK] 기본 추출 완료: {len(state['extraction_results'])}개 결과")
             self._emit(
+                config,
                 "stage_completed",
                 "extraction",
                 description=f"추출 {len(state['extraction_results'])}건",
@@ -103,22 +129,23 @@ class DocumentProcessingGraph:
                 "error_type": type(e).__name__
             })
             state = update_stage(state, "failed")
-            self._emit("stage_failed", "extraction", description=str(e))
+            self._emit(config, "stage_failed", "extraction", description=str(e))
 
         return state
 
-    def validation_node(self, state: DocumentState) -> DocumentState:
+    def validation_node(self, state: DocumentState, config: RunnableConfig) -> DocumentState:
         """2단계: 유효성 검증 노드"""
         from .agents.validation_agent import ValidationAgent
 
         print(f"[2단계] 유효성 검증 시작")
-        self._emit("stage_started", "validation")
+        self._emit(config, "stage_started", "validation")
 
         try:
-            agent = ValidationAgent()
-            state = agent.run(state)
+            agent = self._get_agent("validation", ValidationAgent)
+            state = agent.run(state, api_key=self._api_key(config))
             print(f"[OK] 검증 완료: {len(state['validation_results'])}개 통과")
             self._emit(
+                config,
                 "stage_completed",
                 "validation",
                 description=f"검증 {len(state['validation_results'])}건",
@@ -132,7 +159,7 @@ class DocumentProcessingGraph:
                 "error": str(e),
                 "error_type": type(e).__name__
             })
-            self._emit("stage_failed", "validation", description=str(e))
+            self._emit(config, "stage_failed", "validation", description=str(e))
 
         return state
     
@@ -143,7 +170,7 @@ class DocumentProcessingGraph:
         print(f"[폴백] 폴백 도구 적용 중...")
         
         try:
-            handler = FallbackHandler()
+            handler = self._get_agent("fallback_handler", FallbackHandler)
             state = handler.run(state)
             print(f"[OK] 폴백 처리 완료")
             
@@ -158,19 +185,20 @@ class DocumentProcessingGraph:
         
         return state
     
-    def judge_node(self, state: DocumentState) -> DocumentState:
+    def judge_node(self, state: DocumentState, config: RunnableConfig) -> DocumentState:
         """3단계: LLM Judge 노드"""
         from .agents.judge_agent import JudgeAgent
         
         print(f"[3단계] LLM Judge 평가 시작")
-        self._emit("stage_started", "judge")
+        self._emit(config, "stage_started", "judge")
 
         try:
-            agent = JudgeAgent()
-            state = agent.run(state)
+            agent = self._get_agent("judge", JudgeAgent)
+            state = agent.run(state, api_key=self._api_key(config))
             state = update_stage(state, "report")
             print(f"[OK] 평가 완료: {len(state['judge_results'])}개 결과")
             self._emit(
+                config,
                 "stage_completed",
                 "judge",
                 description=f"판단 {len(state['judge_results'])}건",
@@ -185,23 +213,23 @@ class DocumentProcessingGraph:
                 "error_type": type(e).__name__
             })
             state = update_stage(state, "failed")
-            self._emit("stage_failed", "judge", description=str(e))
+            self._emit(config, "stage_failed", "judge", description=str(e))
 
         return state
 
-    def report_generation_node(self, state: DocumentState) -> DocumentState:
+    def report_generation_node(self, state: DocumentState, config: RunnableConfig) -> DocumentState:
         """리포트 생성 노드"""
         from .agents.report_generator import ReportGenerator
 
         print(f"[리포트] 리포트 생성 중...")
-        self._emit("stage_started", "report")
+        self._emit(config, "stage_started", "report")
 
         try:
-            generator = ReportGenerator()
+            generator = self._get_agent("report_generation", ReportGenerator)
             state = generator.run(state)
             state = update_stage(state, "completed")
             print(f"[OK] 리포트 생성 완료")
-            self._emit("stage_completed", "report", description="리포트 완료")
+            self._emit(config, "stage_completed", "report", description="리포트 완료")
 
         except Exception as e:
             print(f"[ERROR] 리포트 생성 실패: {str(e)}")
@@ -212,7 +240,7 @@ class DocumentProcessingGraph:
                 "error_type": type(e).__name__
             })
             state = update_stage(state, "failed")
-            self._emit("stage_failed", "report", description=str(e))
+            self._emit(config, "stage_failed", "report", description=str(e))
 
         return state
     
@@ -282,10 +310,23 @@ class DocumentProcessingGraph:
         return self.graph.compile()
 
 
+@lru_cache(maxsize=1)
+def _shared_processing_graph() -> Any:
+    """콜백 없는 컴파일된 그래프를 프로세스당 한 번만 생성"""
+    return DocumentProcessingGraph().compile()
+
+
 def create_processing_graph(
     progress_callback: Optional[Callable[..., None]] = None,
 ) -> Any:
-    """문서 처리 그래프 생성 및 컴파일"""
+    """
+    문서 처리 그래프 생성 및 컴파일
+
+    콜백이 없으면 공유 그래프를 반환한다. 문서별 진행 콜백과 API 키는
+    graph.invoke(state, config={"configurable": {"progress_callback": cb, "api_key": key}})로 전달한다.
+    """
+    if progress_callback is None:
+        return _shared_processing_graph()
     graph_builder = DocumentProcessingGraph(progress_callback=progress_callback)
     return graph_builder.compile()
 
@@ -4,18 +4,81 @@ LangGraph 기반 문서 파싱 시스템
 """
 
 import argparse
+import os
 import sys
+import traceback
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
 from datetime import datetime
-from typing import List
-
-# 프로젝트 루트를 path에 추가
-sys.path.insert(0, str(Path(__file__).parent))
+from typing import Any, Dict, List
 
 from . import config
 from .state import create_initial_document_state
 from .graph import create_processing_graph
 from .utils.file_utils import ensure_directories, get_input_files
+from .utils.prefetch import prefetch_files
+
+
+# 워커 프로세스별 컴파일된 그래프 (initializer에서 한 번만 생성)
+_worker_graph = None
+
+
+def _init_worker(debug_mode: bool, use_llm_cache: bool) -> None:
+    """워커 프로세스 초기화: 그래프를 한 번만 생성"""
+    global _worker_graph
+    config.DEBUG_MODE = debug_mode
+    config.LLM_CACHE_ENABLED = use_llm_cache
+    # 이미 파일 단위로 프로세스를 나눴으므로 로컬 파서용 하위 프로세스 풀은 사용하지 않음
+    config.LOCAL_TOOL_PROCESSES = 0
+    config.CUSTOM_SPLIT_RENDER_PROCESSES = 0
+    _worker_graph = create_processing_graph()
+
+
+def _process_one(file_path: str) -> Dict[str, Any]:
+    """워커 프로세스에서 문서 하나를 처리하고 직렬화 가능한 결과 반환"""
+    name = Path(file_path).name
+    state = create_initial_document_state(file_path)
+    
+    try:
+        final_state = _worker_graph.invoke(state)
+    except Exception as e:
+        return {
+            "file": name,
+            "status": "fatal_error",
+            "final_selection": None,
+            "error_count": 1,
+            "error": str(e),
+            "traceback": traceback.format_exc()
+        }
+    
+    return {
+        "file": name,
+        "status": final_state["current_stage"],
+        "final_selection": final_state.get("final_selection"),
+        "error_count": len(final_state.get("error_log", []))
+    }
+
+
+def _print_result(idx: int, total: int, result: Dict[str, Any]) -> None:
+    """문서 하나의 처리 결과 출력 (메인 프로세스에서만 호출)"""
+    print(f"\n{'='*80}")
+    print(f"[{idx}/{total}] {result['file']}")
+    if result["status"] == "completed":
+        print(f"[OK] Processing completed: {result['file']}")
+        selection = result.get("final_selection")
+        if selection:
+            print(f"   Final strategy: {selection.selected_strategy}")
+            print(f"   Score: {selection.S_total:.3f}")
+    elif result["status"] == "fatal_error":
+        print(f"[FATAL ERROR] {result['file']}")
+        print(f"   {result.get('error', '')}")
+        if result.get("traceback"):
+            print(result["traceback"])
+    else:
+        print(f"[FAIL] Processing failed: {result['file']}")
+        print(f"   Status: {result['status']}")
+        print(f"   Errors: {result['error_count']}")
+    print(f"{'='*80}\n")
 
 
 def main():
@@ -46,6 +109,19 @@ def main():
         help="실행할 단계 (기본값: all)"
     )
     
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="동시에 처리할 문서 수 (기본값: min(파일 수, CPU 코어 수))"
+    )
+    
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="LLM 응답 캐시를 사용하지 않음 (항상 API 호출)"
+    )
+    
     parser.add_argument(
         "--debug",
         action="store_true",
@@ -83,73 +159,52 @@ def main():
     print(f"[INFO] Stage: {args.stage}")
     print(f"{'='*80}\n")
     
-    # LangGraph 그래프 생성
-    graph = create_processing_graph()
-    
-    # 각 문서 처리
-    results = []
-    
-    for idx, file_path in enumerate(input_files, 1):
-        print(f"\n{'#'*80}")
-        print(f"[{idx}/{len(input_files)}] {file_path.name}")
-        print(f"{'#'*80}\n")
-        
-        # 초기 상태 생성
-        state = create_initial_document_state(str(file_path))
+    # 여러 파일을 처리할 때는 워커가 파일을 열기 전에 페이지 캐시를 미리 채움
+    if len(input_files) > 1:
+        prefetch_files(input_files)
+    
+    # 문서별 병렬 처리 (파일 간 공유 상태가 없으므로 프로세스 단위로 분산)
+    max_workers = args.workers or min(len(input_files), os.cpu_count() or 1)
+    completed = failed = 0
+    
+    with ProcessPoolExecutor(
+        max_workers=max_workers,
+        initializer=_init_worker,
+        initargs=(config.DEBUG_MODE, not args.no_cache)
+    ) as executor:
+        futures = {
+            executor.submit(_process_one, str(file_path)): file_path
+            for file_path in input_files
+        }
         
-        try:
-            # 그래프 실행
-            final_state = graph.invoke(state)
-            
-            # 결과 저장
-            results.append({
-                "file": file_path.name,
-                "status": final_state["current_stage"],
-                "final_selection": final_state.get("final_selection"),
-                "error_count": len(final_state.get("error_log", []))
-            })
-            
-            # 결과 출력
-            print(f"\n{'='*80}")
-            if final_state["current_stage"] == "completed":
-                print(f"[OK] Processing completed: {file_path.name}")
-                if final_state.get("final_selection"):
-                    selection = final_state["final_selection"]
-                    print(f"   Final strategy: {selection.selected_strategy}")
-                    print(f"   Score: {selection.S_total:.3f}")
+        for idx, future in enumerate(as_completed(futures), 1):
+            file_path = futures[future]
+            try:
+                result = future.result()
+            except Exception as e:
+                # 워커 프로세스 자체가 죽은 경우 (BrokenProcessPool 등)
+                result = {
+                    "file": file_path.name,
+                    "status": "fatal_error",
+                    "final_selection": None,
+                    "error_count": 1,
+                    "error": str(e),
+                    "traceback": None
+                }
+            if result["status"] == "completed":
+                completed += 1
             else:
-                print(f"[FAIL] Processing failed: {file_path.name}")
-                print(f"   Status: {final_state['current_stage']}")
-                print(f"   Errors: {len(final_state.get('error_log', []))}")
-            print(f"{'='*80}\n")
-            
-        except Exception as e:
-            print(f"\n{'='*80}")
-            print(f"[FATAL ERROR] {file_path.name}")
-            print(f"   {str(e)}")
-            print(f"{'='*80}\n")
-            
-            import traceback
-            traceback.print_exc()
-            
-            results.append({
-                "file": file_path.name,
-                "status": "fatal_error",
-                "final_selection": None,
-                "error_count": 1
-            })
+                failed += 1
+            _print_result(idx, len(input_files), result)
     
     # 전체 결과 요약
     print(f"\n{'='*80}")
     print(f"[SUMMARY] Processing Results")
     print(f"{'='*80}")
     
-    completed = sum(1 for r in results if r["status"] == "completed")
-    failed = sum(1 for r in results if r["status"] != "completed")
-    
     print(f"[OK] Success: {completed}")
     print(f"[FAIL] Failed: {failed}")
-    print(f"[TOTAL] Total: {len(results)}")
+    print(f"[TOTAL] Total: {len(input_files)}")
     
     print(f"\n[OUTPUT] Output locations:")
     print(f"   - Reports: {config.REPORTS_DIR}")
@@ -169,7 +224,6 @@ if __name__ == "__main__":
         sys.exit(0)
     except Exception as e:
         print(f"\n[ERROR] Exception occurred: {str(e)}\n")
-        import traceback
-        traceback.print_exc()
+        traceback.print_exception(type(e), e, e.__traceback__, file=sys.stderr)
         sys.exit(1)
 
@@ -4,9 +4,10 @@ Pass된 텍스트들을 비교하여 세부 품질 점수 산출
 """
 
 import json
-import re
 from typing import List, Dict, Any
 
+from ..utils.json_utils import loads, strip_code_fence
+
 
 def create_judge_prompt(
     strategy: str,
@@ -25,20 +26,16 @@ def create_judge_prompt(
         프롬프트 문자열
     """
     
-    # 텍스트 샘플 추출 (최대 1000자)
-    text_samples = []
-    for page in pages[:1]:  # 대표 1페이지만
-        text = page.get("text", "")[:1000]
-        text_samples.append(f"[페이지 {page.get('page', '?')}]\n{text}")
-    
-    sample_text = "\n\n".join(text_samples)
+    # 텍스트 샘플 추출 (대표 1페이지, 최대 1000자)
+    if pages:
+        first_page = pages[0]
+        sample_text = f"[페이지 {first_page.get('page', '?')}]\n{first_page.get('text', '')[:1000]}"
+    else:
+        sample_text = ""
     
-    # 표 정보
-    has_tables = any(page.get("tables", []) for page in pages)
-    table_info = ""
-    if has_tables:
-        total_tables = sum(len(page.get("tables", [])) for page in pages)
-        table_info = f"\n표 포함: 총 {total_tables}개"
+    # 표 정보 (페이지를 한 번만 순회)
+    total_tables = sum(len(page.get("tables") or ()) for page in pages)
+    table_info = f"\n표 포함: 총 {total_tables}개" if total_tables else ""
     
     prompt = f"""당신은 PDF 텍스트 추출 품질을 **정밀 평가**하는 전문가입니다.
 
@@ -185,17 +182,10 @@ def parse_judge_response(response_content: str) -> Dict[str, Any]:
     json_str = response_content.strip()
     
     # 마크다운 코드블록 제거
-    if "```json" in json_str:
-        json_match = re.search(r'```json\s*(.*?)\s*```', json_str, re.DOTALL)
-        if json_match:
-            json_str = json_match.group(1)
-    elif "```" in json_str:
-        json_match = re.search(r'```\s*(.*?)\s*```', json_str, re.DOTALL)
-        if json_match:
-            json_str = json_match.group(1)
+    json_str = strip_code_fence(json_str)
     
     try:
-        data = json.loads(json_str)
+        data = loads(json_str)
         
         # 점수 추출 및 검증 (0-100 범위)
         scores = {
@@ -3,9 +3,10 @@
 2단계에서 텍스트 추출 결과가 유효한지 Pass/Fail 판단
 """
 
-import json
 from typing import Dict, List, Any
 
+from ..utils.json_utils import loads, strip_code_fence
+
 
 def create_validation_prompt(
     page_text: str,
@@ -129,17 +130,10 @@ def parse_validation_response(response_text: str) -> Dict[str, Any]:
         text = response_text.strip()
         
         # ```json ... ``` 형식 처리
-        if "```json" in text:
-            start = text.find("```json") + 7
-            end = text.find("```", start)
-            text = text[start:end].strip()
-        elif "```" in text:
-            start = text.find("```") + 3
-            end = text.find("```", start)
-            text = text[start:end].strip()
+        text = strip_code_fence(text)
         
         # JSON 파싱
-        result = json.loads(text)
+        result = loads(text)
         
         # 필수 필드 검증
         return {
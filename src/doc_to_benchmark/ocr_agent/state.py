@@ -8,7 +8,7 @@ from datetime import datetime
 from dataclasses import dataclass, field
 
 
-@dataclass
+@dataclass(slots=True)
 class PageExtractionResult:
     """페이지별 추출 결과"""
     page_num: int  # 페이지 번호
@@ -22,7 +22,7 @@ class PageExtractionResult:
     metadata: Dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class ExtractionResult:
     """기본 추출 결과 (전체 문서)"""
     strategy: str  # 'pdfplumber', 'pdfminer', 'pypdfium2', 'upstage_ocr', 'upstage_document_parse', etc.
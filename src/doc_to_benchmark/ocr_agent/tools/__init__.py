@@ -2,14 +2,32 @@
 OCR/파싱 도구 모듈
 """
 
-from .pdfplumber_tool import PDFPlumberTool
-from .pdfminer_tool import PDFMinerTool
-from .pypdfium2_tool import PyPDFium2Tool
-from .upstage_ocr_tool import UpstageOCRTool
-from .upstage_document_parse_tool import UpstageDocumentParseTool
-from .custom_split_tool import CustomSplitTool
-from .layout_parser_tool import LayoutParserTool
-from .table_enhancement_tool import TableEnhancementTool
+import importlib
+from typing import Any
+
+# 도구 클래스는 처음 접근할 때 import (pdfplumber, fitz 등 무거운 의존성 지연 로드)
+_TOOL_MODULES = {
+    "PDFPlumberTool": ".pdfplumber_tool",
+    "PDFMinerTool": ".pdfminer_tool",
+    "PyPDFium2Tool": ".pypdfium2_tool",
+    "UpstageOCRTool": ".upstage_ocr_tool",
+    "UpstageDocumentParseTool": ".upstage_document_parse_tool",
+    "CustomSplitTool": ".custom_split_tool",
+    "LayoutParserTool": ".layout_parser_tool",
+    "TableEnhancementTool": ".table_enhancement_tool",
+    "get_pdfplumber_tool": ".pdfplumber_tool",
+    "get_pdfminer_tool": ".pdfminer_tool",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _TOOL_MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
 
 __all__ = [
     "PDFPlumberTool",
@@ -19,6 +37,7 @@ __all__ = [
     "UpstageDocumentParseTool",
     "CustomSplitTool",
     "LayoutParserTool",
-    "TableEnhancementTool"
+    "TableEnhancementTool",
+    "get_pdfplumber_tool",
+    "get_pdfminer_tool"
 ]
-
@@ -7,19 +7,51 @@ pdf_split.py의 검증된 이중 페이지 감지 로직 사용
 from __future__ import annotations
 
 import io
-from typing import Dict, List, Any, Tuple, Iterable
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Any, Optional, Tuple, Iterable, Sequence
 from pathlib import Path
 
 import cv2
 import fitz  # PyMuPDF
 import numpy as np
 from PIL import Image
-from pypdf import PdfReader, PdfWriter
 
 from .. import config
 
 
 LayoutMetrics = dict[str, float | int]
+# 분할된 페이지 조각 하나: (JPEG 바이트, 너비, 높이)
+EncodedSegment = Tuple[bytes, int, int]
+
+_render_pool: Optional[ProcessPoolExecutor] = None
+_render_pool_lock = threading.Lock()
+
+
+def get_render_pool() -> Optional[ProcessPoolExecutor]:
+    """페이지 렌더링용 프로세스 풀 반환 (처음 호출 시 생성, 비활성화 시 None)"""
+    global _render_pool
+    if config.CUSTOM_SPLIT_RENDER_PROCESSES <= 1:
+        return None
+    with _render_pool_lock:
+        if _render_pool is None:
+            # forkserver는 무거운 모듈을 매번 다시 fork하지 않음 (미지원 플랫폼은 spawn)
+            method = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+            _render_pool = ProcessPoolExecutor(
+                max_workers=config.CUSTOM_SPLIT_RENDER_PROCESSES,
+                mp_context=multiprocessing.get_context(method),
+            )
+        return _render_pool
+
+
+def shutdown_render_pool() -> None:
+    """렌더링 프로세스 풀 종료"""
+    global _render_pool
+    with _render_pool_lock:
+        if _render_pool is not None:
+            _render_pool.shutdown(cancel_futures=True)
+            _render_pool = None
 
 
 class CustomSplitTool:
@@ -61,52 +93,62 @@ class CustomSplitTool:
     
     def _process_pdf_bytes(self, source: bytes) -> bytes:
         """PDF 바이트 처리 및 이중 페이지 분할"""
-        pil_pages = self._render_pages(source, self.settings["dpi"])
-        if not pil_pages:
+        page_segments = self._render_segments(source, self.settings["dpi"])
+        if not page_segments:
             return source
         
-        writer = PdfWriter()
-        buffers: list[io.BytesIO] = []
-        
-        for pil_page, layout in pil_pages:
-            for segment in self._split_page(pil_page, layout):
-                segment_rgb = segment.convert("RGB")
-                pdf_buffer = io.BytesIO()
-                segment_rgb.save(pdf_buffer, format="PDF")
-                pdf_buffer.seek(0)
-                buffers.append(pdf_buffer)
-                
-                reader = PdfReader(pdf_buffer)
-                writer.add_page(reader.pages[0])
-        
-        output = io.BytesIO()
-        writer.write(output)
-        output.seek(0)
-        
-        for buffer in buffers:
-            buffer.close()
-        
-        return output.read()
+        # PyMuPDF로 결과 PDF를 직접 구성 (조각당 JPEG 이미지 1장, PIL PDF 저장과 같이 1px = 1pt)
+        with fitz.open() as output:
+            for segments in page_segments:
+                for jpeg, width, height in segments:
+                    page = output.new_page(width=width, height=height)
+                    page.insert_image(page.rect, stream=jpeg)
+            return output.tobytes()
     
-    def _render_pages(self, source: bytes, dpi: int) -> list[Tuple[Image.Image, LayoutMetrics]]:
-        """PDF 페이지를 이미지로 렌더링하고 레이아웃 메트릭 계산"""
+    def _render_segments(self, source: bytes, dpi: int) -> list[list[EncodedSegment]]:
+        """페이지별로 렌더링 → 이중 페이지 분할 → JPEG 인코딩한 조각 목록"""
         try:
             with fitz.open(stream=source, filetype="pdf") as pdf:
-                zoom = max(dpi, 72) / 72
-                matrix = fitz.Matrix(zoom, zoom)
-                pages: list[Tuple[Image.Image, LayoutMetrics]] = []
-                for page in pdf:
-                    pixmap = page.get_pixmap(matrix=matrix, alpha=False)
-                    image = Image.frombytes("RGB", (pixmap.width, pixmap.height), pixmap.samples)
-                    layout = self._measure_page_layout(page)
-                    pages.append((image.copy(), layout))
-                return pages
+                page_count = pdf.page_count
+                pool = get_render_pool() if page_count >= config.CUSTOM_SPLIT_PARALLEL_MIN_PAGES else None
+                if pool is None:
+                    matrix = _zoom_matrix(dpi)
+                    return [self._encode_page(page, matrix) for page in pdf]
+            
+            # 페이지끼리 독립적이므로 공용 프로세스 풀에 워커 수만큼 구간으로 나눠 제출
+            # (구간마다 문서를 한 번만 열고, 원본 픽셀 대신 JPEG 바이트만 돌려받음)
+            workers = min(config.CUSTOM_SPLIT_RENDER_PROCESSES, page_count)
+            bounds = [page_count * index // workers for index in range(workers + 1)]
+            futures = [
+                pool.submit(_render_worker_range, source, start, stop, dpi)
+                for start, stop in zip(bounds, bounds[1:])
+            ]
+            return [segments for future in futures for segments in future.result()]
         except Exception as exc:
             raise ValueError(f"PDF 렌더링 실패: {exc}") from exc
     
-    def _measure_page_layout(self, page: fitz.Page) -> LayoutMetrics:
-        """페이지 레이아웃 메트릭 측정"""
-        rect = page.rect
+    def _encode_page(self, page: fitz.Page, matrix: fitz.Matrix) -> list[EncodedSegment]:
+        """페이지 하나를 렌더링하고 (필요하면 좌우로 나눠) JPEG으로 인코딩"""
+        pil_page, layout = self._render_page(page, matrix)
+        encoded: list[EncodedSegment] = []
+        for segment in self._split_page(pil_page, layout):
+            segment_rgb = segment.convert("RGB")
+            image_buffer = io.BytesIO()
+            segment_rgb.save(image_buffer, format="JPEG")
+            width, height = segment_rgb.size
+            encoded.append((image_buffer.getvalue(), width, height))
+        return encoded
+    
+    def _render_page(self, page: fitz.Page, matrix: fitz.Matrix) -> Tuple[Image.Image, LayoutMetrics]:
+        """페이지 하나를 렌더링하고 레이아웃 메트릭 계산"""
+        pixmap = page.get_pixmap(matrix=matrix, alpha=False)
+        # frombytes가 픽셀을 PIL 소유 버퍼로 복사하므로 pixmap 해제 후에도 안전 (추가 copy 불필요)
+        image = Image.frombytes("RGB", (pixmap.width, pixmap.height), pixmap.samples)
+        layout = self._measure_page_layout(page.rect, page.get_text("blocks"))
+        return image, layout
+    
+    def _measure_page_layout(self, rect: fitz.Rect, blocks: Sequence[tuple]) -> LayoutMetrics:
+        """페이지 레이아웃 메트릭 측정 (blocks: 페이지에서 추출해 둔 get_text("blocks") 결과)"""
         width = float(rect.width)
         height = float(rect.height)
         page_area = width * height if width > 0 and height > 0 else 0.0
@@ -130,96 +172,79 @@ class CustomSplitTool:
         if page_area == 0.0:
             return metrics
         
-        for block in page.get_text("blocks"):
-            if len(block) < 4:
-                continue
-            x0, y0, x1, y1 = block[:4]
-            block_width = max(0.0, float(x1) - float(x0))
-            block_height = max(0.0, float(y1) - float(y0))
-            if block_width <= 0 or block_height <= 0:
-                continue
-            
-            area = block_width * block_height
-            if area == 0:
-                continue
-            
-            left_width = max(0.0, min(x1, mid_x) - x0)
-            right_width = max(0.0, x1 - max(x0, mid_x))
-            left_ratio = left_width / block_width if block_width else 0.0
-            right_ratio = right_width / block_width if block_width else 0.0
-            
-            if left_ratio > 0:
-                metrics["left_area"] += area * left_ratio
-            if right_ratio > 0:
-                metrics["right_area"] += area * right_ratio
-            
-            band_left = max(x0, left_boundary)
-            band_right = min(x1, right_boundary)
-            band_width = max(0.0, band_right - band_left)
-            if band_width > 0 and block_width > 0:
-                metrics["center_area"] += area * (band_width / block_width)
-            
-            metrics["max_block_width_ratio"] = max(
-                metrics["max_block_width_ratio"], block_width / max(width, 1.0)
-            )
-            
-            if x1 <= mid_x:
-                metrics["left_blocks"] += 1
-            elif x0 >= mid_x:
-                metrics["right_blocks"] += 1
-            else:
-                metrics["bridge_blocks"] += 1
-                overlap_ratio = min(left_ratio, right_ratio)
-                if overlap_ratio > 0:
-                    metrics["bridge_area"] += area * overlap_ratio
+        # 블록 좌표를 (N, 4) 배열로 모아 전체 블록을 한 번에 계산
+        coords = np.asarray(
+            [block[:4] for block in blocks if len(block) >= 4], dtype=np.float64
+        ).reshape(-1, 4)
+        x0, y0, x1, y1 = coords.T
+        block_width = np.maximum(x1 - x0, 0.0)
+        block_height = np.maximum(y1 - y0, 0.0)
+        area = block_width * block_height
+        # 폭/높이가 0인 블록 제외
+        valid = (block_width > 0) & (block_height > 0) & (area > 0)
+        if not valid.any():
+            return metrics
+        x0, x1 = x0[valid], x1[valid]
+        block_width, area = block_width[valid], area[valid]
+        
+        left_ratio = np.maximum(0.0, np.minimum(x1, mid_x) - x0) / block_width
+        right_ratio = np.maximum(0.0, x1 - np.maximum(x0, mid_x)) / block_width
+        band_width = np.maximum(0.0, np.minimum(x1, right_boundary) - np.maximum(x0, left_boundary))
+        
+        metrics["left_area"] = float(np.sum(area * left_ratio))
+        metrics["right_area"] = float(np.sum(area * right_ratio))
+        metrics["center_area"] = float(np.sum(area * (band_width / block_width)))
+        metrics["max_block_width_ratio"] = float(block_width.max()) / max(width, 1.0)
+        
+        left_mask = x1 <= mid_x
+        right_mask = ~left_mask & (x0 >= mid_x)
+        # 중앙선을 넘는 블록 (좌/우 어느 쪽에도 완전히 속하지 않음)
+        bridge_mask = ~(left_mask | right_mask)
+        metrics["left_blocks"] = int(np.count_nonzero(left_mask))
+        metrics["right_blocks"] = int(np.count_nonzero(right_mask))
+        metrics["bridge_blocks"] = int(np.count_nonzero(bridge_mask))
+        overlap_ratio = np.minimum(left_ratio, right_ratio)[bridge_mask]
+        metrics["bridge_area"] = float(np.sum(area[bridge_mask] * overlap_ratio))
         
         return metrics
     
     def _is_double_page(self, pil_img: Image.Image, layout: LayoutMetrics | None = None) -> bool:
         """이중 페이지 스프레드 감지 (휴리스틱 기반)"""
         
-        grayscale = np.array(pil_img.convert("L"))
-        height, width = grayscale.shape
+        width, height = pil_img.size
         if height == 0 or width == 0:
             return False
         
         aspect_ratio = width / max(height, 1)
+        # 최종 판정에 가로/세로 비 1.2 이상이 필요하므로, 그보다 좁은 페이지는 이미지 처리 전에 종료
+        if aspect_ratio < 1.2:
+            return False
+        
+        grayscale = np.array(pil_img.convert("L"))
         
         # 전경(텍스트, 그림) 강조
         _, binary = cv2.threshold(grayscale, 0, 255, cv2.THRESH_BINARY_INV + cv2.THRESH_OTSU)
-        foreground = binary > 0
-        
-        if aspect_ratio < 1.1:
-            return False
         
         mid_x = width // 2
         gap_half_width = max(2, int(width * 0.03))  # 중앙 6% 대역
         left_end = max(0, mid_x - gap_half_width)
         right_start = min(width, mid_x + gap_half_width)
         
-        def _region_density(region: np.ndarray | None) -> float:
-            if region is None or region.size == 0:
-                return 0.0
-            return float(np.mean(region))
-        
-        left_region = foreground[:, :left_end] if left_end > 0 else None
-        right_region = foreground[:, right_start:] if right_start < width else None
-        centre_region = foreground[:, left_end:right_start] if right_start > left_end else None
+        # 열별 전경 비율을 한 번만 계산 (영역 밀도 = 해당 열들의 평균이므로 프로파일/이음새 검사와 공유)
+        column_density = np.count_nonzero(binary, axis=0) / height
         
-        left_density = _region_density(left_region)
-        right_density = _region_density(right_region)
-        centre_density = _region_density(centre_region)
+        left_density = float(column_density[:left_end].mean()) if left_end > 0 else 0.0
+        right_density = float(column_density[right_start:].mean()) if right_start < width else 0.0
+        centre_density = float(column_density[left_end:right_start].mean()) if right_start > left_end else 0.0
         
-        column_density = foreground.mean(axis=0)
-        left_profile = float(column_density[:left_end].mean()) if left_end > 0 else 0.0
-        right_profile = float(column_density[right_start:].mean()) if right_start < width else 0.0
-        centre_profile = float(column_density[left_end:right_start].mean()) if right_start > left_end else 1.0
+        left_profile = left_density
+        right_profile = right_density
+        centre_profile = centre_density if right_start > left_end else 1.0
         
         side_profile = min(value for value in (left_profile, right_profile) if value > 0) if any(
             value > 0 for value in (left_profile, right_profile)
         ) else 0.0
         
-        aspect_condition = aspect_ratio >= 1.2
         density_condition = (
             left_density > 0.02
             and right_density > 0.02
@@ -239,13 +264,14 @@ class CustomSplitTool:
                 right_contours += 1
         contour_condition = left_contours > 3 and right_contours > 3
         
-        column_density = foreground.mean(axis=0)
         window = max(3, int(width * 0.01))
         if window % 2 == 0:
             window += 1
         if window > 1:
-            kernel = np.ones(window, dtype=np.float64) / window
-            smoothed = np.convolve(column_density, kernel, mode="same")
+            # 이동 평균 (np.convolve mode="same"과 동일하게 경계 밖은 0으로 취급)
+            smoothed = cv2.boxFilter(
+                column_density.reshape(1, -1), -1, (window, 1), borderType=cv2.BORDER_CONSTANT
+            ).ravel()
         else:
             smoothed = column_density
         
@@ -263,9 +289,7 @@ class CustomSplitTool:
         
         seam_condition = side_mean > 0 and band_min < side_mean * 0.4
         
-        return aspect_condition and (
-            density_condition or profile_condition or contour_condition or seam_condition
-        )
+        return density_condition or profile_condition or contour_condition or seam_condition
     
     def _split_page(self, pil_img: Image.Image, layout: LayoutMetrics | None = None) -> Iterable[Image.Image]:
         """페이지 분할 (이중 페이지 감지 시)"""
@@ -317,6 +341,26 @@ class CustomSplitTool:
         return split_pages
 
 
+def _zoom_matrix(dpi: int) -> fitz.Matrix:
+    """DPI에 해당하는 렌더링 배율 행렬"""
+    zoom = max(dpi, 72) / 72
+    return fitz.Matrix(zoom, zoom)
+
+
+# 렌더링 워커 프로세스별 도구 인스턴스 (처음 작업 때 생성 후 재사용)
+_worker_tool: CustomSplitTool | None = None
+
+
+def _render_worker_range(source: bytes, start: int, stop: int, dpi: int) -> list[list[EncodedSegment]]:
+    """렌더링 워커에서 [start, stop) 구간의 페이지 처리"""
+    global _worker_tool
+    if _worker_tool is None:
+        _worker_tool = CustomSplitTool()
+    matrix = _zoom_matrix(dpi)
+    with fitz.open(stream=source, filetype="pdf") as pdf:
+        return [_worker_tool._encode_page(pdf[index], matrix) for index in range(start, stop)]
+
+
 if __name__ == "__main__":
     # 테스트
     tool = CustomSplitTool()
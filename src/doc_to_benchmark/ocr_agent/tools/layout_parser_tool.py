@@ -6,6 +6,45 @@ Layout Parser 도구
 from typing import Dict, List, Any
 import numpy as np
 
+from ..utils.bbox import bbox_arrays
+
+# 컬럼 사이 여백으로 인정할 최소 간격 (페이지 폭 대비 비율)
+COLUMN_GAP_RATIO = 0.04
+# 하나의 컬럼으로 인정할 최소 bbox 수 / 전체 대비 최소 비율
+MIN_COLUMN_BOXES = 5
+MIN_COLUMN_FRACTION = 0.1
+
+
+def cluster_x_centers(x_centers: np.ndarray, page_width: float, k_max: int = 3) -> np.ndarray:
+    """
+    X 중심점 1차원 클러스터링 (k = 1..k_max)
+    
+    정렬된 중심점 사이의 가장 큰 간격부터 분할 후보로 보고, 간격이 충분히 넓고
+    (컬럼 여백) 분할된 모든 컬럼이 최소 크기를 넘을 때만 분할을 채택한다.
+    
+    Returns:
+        bbox별 컬럼 번호 (0 = 가장 왼쪽 컬럼)
+    """
+    n = x_centers.size
+    order = np.argsort(x_centers, kind="stable")
+    x_sorted = x_centers[order]
+    gaps = np.diff(x_sorted)
+    
+    min_gap = page_width * COLUMN_GAP_RATIO
+    min_size = max(MIN_COLUMN_BOXES, int(np.ceil(n * MIN_COLUMN_FRACTION)))
+    
+    splits: List[int] = []
+    for gap_idx in np.argsort(gaps, kind="stable")[::-1][:k_max - 1]:
+        if gaps[gap_idx] < min_gap or gaps[gap_idx] == 0:
+            break
+        candidate = sorted(splits + [int(gap_idx) + 1])
+        if np.diff([0, *candidate, n]).min() >= min_size:
+            splits = candidate
+    
+    # 분할 지점의 X 값을 경계로 bbox를 한 번에 분류 (경계 양쪽 값은 항상 달라 동률 없음)
+    thresholds = x_sorted[np.asarray(splits, dtype=np.intp)]
+    return np.searchsorted(thresholds, x_centers, side="right")
+
 
 class LayoutParserTool:
     """레이아웃 기반 재정렬 도구"""
@@ -48,15 +87,15 @@ class LayoutParserTool:
         if not bbox_list:
             return page
         
-        # 다단 감지
-        columns = self._detect_columns(bbox_list, page.get("width", 800))
+        # 좌표를 필드별 NumPy 배열(SoA)로 한 번에 변환
+        coords = bbox_arrays(bbox_list, ("x0", "x1", "y0"))
+        
+        # 다단 감지 (bbox별 컬럼 번호, 0 = 왼쪽)
+        column_ids = self._detect_columns(coords, page.get("width", 800))
         
-        # 각 컬럼별로 정렬
-        sorted_bbox = []
-        for col_bbox_list in columns:
-            # Y 좌표 기준으로 정렬 (위에서 아래로)
-            col_sorted = sorted(col_bbox_list, key=lambda b: b["y0"])
-            sorted_bbox.extend(col_sorted)
+        # 컬럼 순 → 컬럼 내 Y 좌표 순 정렬 (위에서 아래로, lexsort는 안정 정렬이라 동률은 원래 순서 유지)
+        order = np.lexsort((coords["y0"], column_ids))
+        sorted_bbox = [bbox_list[i] for i in order]
         
         # 재정렬된 텍스트 재구성
         reordered_text = " ".join([b["text"] for b in sorted_bbox])
@@ -66,45 +105,19 @@ class LayoutParserTool:
         new_page["bbox"] = sorted_bbox
         new_page["source"] = page["source"] + "+layout"
         new_page["layout_info"] = {
-            "columns_detected": len(columns),
+            "columns_detected": int(column_ids.max()) + 1,
             "reordered": True
         }
         
         return new_page
     
-    def _detect_columns(self, bbox_list: List[Dict], page_width: float) -> List[List[Dict]]:
-        """다단 레이아웃 감지"""
+    def _detect_columns(self, coords: Dict[str, np.ndarray], page_width: float) -> np.ndarray:
+        """다단 레이아웃 감지 (bbox별 컬럼 번호 배열 반환, 0 = 가장 왼쪽)"""
         
-        # X 좌표 중심점 추출
-        x_centers = [(bbox["x0"] + bbox["x1"]) / 2 for bbox in bbox_list]
-        
-        if not x_centers:
-            return [bbox_list]
-        
-        # 간단한 K-means 스타일 클러스터링
-        # 일단 2단 가정
-        threshold = page_width / 2
-        
-        left_column = []
-        right_column = []
-        
-        for bbox in bbox_list:
-            x_center = (bbox["x0"] + bbox["x1"]) / 2
-            
-            if x_center < threshold:
-                left_column.append(bbox)
-            else:
-                right_column.append(bbox)
-        
-        # 왼쪽 컬럼 먼저, 오른쪽 컬럼 나중
-        columns = []
-        if left_column:
-            columns.append(left_column)
-        if right_column:
-            columns.append(right_column)
-        
-        return columns if len(columns) > 1 else [bbox_list]
-
+        # X 좌표 중심점을 1차원 클러스터링
+        x_centers = np.add(coords["x0"], coords["x1"])
+        x_centers *= 0.5
+        return cluster_x_centers(x_centers, page_width)
 
 if __name__ == "__main__":
     # 테스트
@@ -3,9 +3,11 @@ PDFMiner.six 도구
 텍스트 레이어 추출 (레이아웃 분석 강화)
 """
 
+import io
+
 from pdfminer.high_level import extract_pages, extract_text
 from pdfminer.layout import LTTextContainer, LTChar, LTTextBox, LTTextLine
-from typing import Dict, List, Any, Union
+from typing import Dict, Iterable, Iterator, List, Any, Optional, Union
 from pathlib import Path
 
 
@@ -19,12 +21,17 @@ class PDFMinerTool:
             "char_margin": 2.0
         }
     
-    def extract(self, pdf_path: Union[str, Path]) -> Dict[str, Any]:
+    def extract(
+        self,
+        pdf_path: Union[str, Path],
+        page_numbers: Optional[Iterable[int]] = None
+    ) -> Dict[str, Any]:
         """
         PDF 파일에서 텍스트 추출
         
         Args:
             pdf_path: PDF 파일 경로
+            page_numbers: 추출할 페이지 번호 (1부터 시작, None이면 전체)
             
         Returns:
             {
@@ -33,51 +40,8 @@ class PDFMinerTool:
             }
         """
         
-        # Path 객체로 변환
-        if not isinstance(pdf_path, Path):
-            pdf_path = Path(pdf_path)
-        
-        pages_data = []
-        
         try:
-            # 페이지별 추출
-            for page_num, page_layout in enumerate(extract_pages(str(pdf_path)), 1):
-                # 텍스트 추출
-                text_elements = []
-                bbox_elements = []
-                
-                for element in page_layout:
-                    if isinstance(element, LTTextContainer):
-                        text_elements.append(element.get_text())
-                        
-                        # bbox 정보 추출
-                        try:
-                            bbox_elements.append({
-                                "text": element.get_text().strip(),
-                                "x0": float(element.x0),
-                                "y0": float(element.y0),
-                                "x1": float(element.x1),
-                                "y1": float(element.y1),
-                                "top": float(element.y0),
-                                "bottom": float(element.y1)
-                            })
-                        except:
-                            pass
-                
-                page_text = "".join(text_elements)
-                
-                page_data = {
-                    "page": page_num,
-                    "source": "pdfminer",
-                    "text": page_text,
-                    "bbox": bbox_elements,
-                    "tables": [],  # PDFMiner는 기본적으로 표 감지 안 함
-                    "width": float(page_layout.width),
-                    "height": float(page_layout.height)
-                }
-                
-                pages_data.append(page_data)
-        
+            pages_data = list(self.extract_iter(pdf_path, page_numbers))
         except Exception as e:
             print(f"[ERROR] PDFMiner extraction failed: {e}")
             return {"pages": [], "settings": self.settings}
@@ -87,6 +51,70 @@ class PDFMinerTool:
             "settings": self.settings
         }
     
+    def extract_iter(
+        self,
+        pdf_path: Union[str, Path],
+        page_numbers: Optional[Iterable[int]] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        페이지를 파싱하는 대로 하나씩 반환 (전체 문서를 메모리에 모으지 않음)
+        
+        Args:
+            pdf_path: PDF 파일 경로
+            page_numbers: 추출할 페이지 번호 (1부터 시작, None이면 전체)
+            
+        Yields:
+            {"page": 1, "source": "pdfminer", "text": "...", "bbox": [...], ...}
+        """
+        
+        # Path 객체로 변환
+        if not isinstance(pdf_path, Path):
+            pdf_path = Path(pdf_path)
+        
+        # 페이지별 추출 (pdfminer는 0부터 시작하는 인덱스, 문서 순서대로 반환)
+        if page_numbers is None:
+            layouts = enumerate(extract_pages(str(pdf_path)), 1)
+        else:
+            selected = sorted(set(page_numbers))
+            layouts = zip(
+                selected,
+                extract_pages(str(pdf_path), page_numbers=[page_num - 1 for page_num in selected])
+            )
+        
+        for page_num, page_layout in layouts:
+            # 텍스트 추출
+            text_buffer = io.StringIO()
+            bbox_elements = []
+            
+            for element in page_layout:
+                if isinstance(element, LTTextContainer):
+                    element_text = element.get_text()
+                    text_buffer.write(element_text)
+                    
+                    # bbox 정보 추출
+                    try:
+                        bbox_elements.append({
+                            "text": element_text.strip(),
+                            "x0": float(element.x0),
+                            "y0": float(element.y0),
+                            "x1": float(element.x1),
+                            "y1": float(element.y1),
+                            "top": float(element.y0),
+                            "bottom": float(element.y1)
+                        })
+                    except:
+                        pass
+            
+            yield {
+                "page": page_num,
+                "source": "pdfminer",
+                "text": text_buffer.getvalue(),
+                "bbox": bbox_elements,
+                "tables": [],  # PDFMiner는 기본적으로 표 감지 안 함
+                "width": float(page_layout.width),
+                "height": float(page_layout.height)
+            }
+    
     def process(self, pages: List[Dict], pdf_path: Union[str, Path]) -> List[Dict]:
         """
         폴백 도구 인터페이스 (2단계 호환)
@@ -103,6 +131,17 @@ class PDFMinerTool:
         return result["pages"]
 
 
+_instance: Optional[PDFMinerTool] = None
+
+
+def get_pdfminer_tool() -> PDFMinerTool:
+    """프로세스 공용 PDFMinerTool 인스턴스 반환 (도구 상태는 파일과 무관하므로 재사용)"""
+    global _instance
+    if _instance is None:
+        _instance = PDFMinerTool()
+    return _instance
+
+
 if __name__ == "__main__":
     # 테스트
     tool = PDFMinerTool()
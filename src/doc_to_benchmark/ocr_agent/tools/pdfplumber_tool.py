@@ -3,8 +3,12 @@ pdfplumber 도구
 텍스트 레이어 추출
 """
 
+import mmap
+import os
+from contextlib import contextmanager
+
 import pdfplumber
-from typing import Dict, List, Any, Union
+from typing import Dict, Iterable, Iterator, List, Any, Optional, Union
 from pathlib import Path
 from .. import config
 
@@ -18,12 +22,17 @@ class PDFPlumberTool:
             "layout_height_tolerance": config.PDF_PLUMBER_LAYOUT_HEIGHT_TOLERANCE
         }
     
-    def extract(self, pdf_path: Union[str, Path]) -> Dict[str, Any]:
+    def extract(
+        self,
+        pdf_path: Union[str, Path],
+        page_numbers: Optional[Iterable[int]] = None
+    ) -> Dict[str, Any]:
         """
         PDF 파일에서 텍스트 추출
         
         Args:
             pdf_path: PDF 파일 경로 (str 또는 Path 객체)
+            page_numbers: 추출할 페이지 번호 (1부터 시작, None이면 전체)
             
         Returns:
             {
@@ -36,62 +45,127 @@ class PDFPlumberTool:
         if not isinstance(pdf_path, Path):
             pdf_path = Path(pdf_path)
         
-        pages_data = []
-        
-        # Windows에서 한글 경로 처리를 위해 파일을 바이너리로 읽어서 전달
-        with open(pdf_path, 'rb') as f:
-            with pdfplumber.open(f) as pdf:
-                for page_num, page in enumerate(pdf.pages, 1):
-                    # 텍스트 추출
-                    text = page.extract_text() or ""
-                    
-                    # 단어별 bbox 정보 (안전하게 처리)
-                    words = page.extract_words() or []
-                    
-                    # 테이블 감지
-                    tables = page.extract_tables() or []
-                    
-                    page_data = {
-                        "page": page_num,
-                        "source": "plumber",
-                        "text": text,
-                        "bbox": [
-                            {
-                                "text": word.get("text", ""),
-                                "x0": word.get("x0", 0),
-                                "y0": word.get("y0", 0),
-                                "x1": word.get("x1", 0),
-                                "y1": word.get("y1", 0),
-                                "top": word.get("top", 0),
-                                "bottom": word.get("bottom", 0)
-                            }
-                            for word in words
-                            if word and isinstance(word, dict)
-                        ],
-                        "tables": [
-                            {
-                                "rows": len(table),
-                                "cols": len(table[0]) if table else 0,
-                                "data": table
-                            }
-                            for table in tables
-                        ] if tables else [],
-                        "width": page.width,
-                        "height": page.height
-                    }
-                    
-                    pages_data.append(page_data)
+        # pdfplumber/pdfminer는 순수 파이썬이라 GIL을 잡으므로 스레드로 나누지 않고 순차 추출
+        # (병렬성은 로컬 파서 프로세스 풀에서 확보)
+        selected = sorted(set(page_numbers)) if page_numbers is not None else None
+        pages_data = self._extract_pages(pdf_path, selected)
         
         return {
             "pages": pages_data,
             "settings": self.settings
         }
     
+    @contextmanager
+    def _open_pdf(self, pdf_path: Path, pages: Optional[List[int]] = None) -> Iterator[Any]:
+        """
+        PDF 열기
+        - Windows 한글 경로: 파일 객체로 열어서 전달
+        - 대용량 파일: mmap으로 매핑해 버퍼 복사 없이 전달
+        - 그 외: 경로를 그대로 전달
+        """
+        if os.name == "nt" and not pdf_path.as_posix().isascii():
+            with open(pdf_path, "rb") as f, pdfplumber.open(f, pages=pages) as pdf:
+                yield pdf
+        elif pdf_path.stat().st_size >= config.PDF_PLUMBER_MMAP_THRESHOLD:
+            with open(pdf_path, "rb") as f, \
+                    mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, \
+                    pdfplumber.open(mm, pages=pages) as pdf:
+                yield pdf
+        else:
+            with pdfplumber.open(str(pdf_path), pages=pages) as pdf:
+                yield pdf
+    
+    def _extract_pages(self, pdf_path: Path, page_numbers: Optional[List[int]]) -> List[Dict[str, Any]]:
+        """주어진 페이지들만 열어서 추출 (None이면 전체)"""
+        pages_data = []
+        with self._open_pdf(pdf_path, pages=page_numbers) as pdf:
+            for page in pdf.pages:
+                pages_data.append(self._extract_page(page))
+        return pages_data
+    
+    def _extract_page(self, page: Any) -> Dict[str, Any]:
+        """페이지 하나의 텍스트/bbox/테이블 추출"""
+        # 단어별 bbox 정보 (dict가 아닌 항목은 한 번만 걸러냄)
+        words = [word for word in page.extract_words() or [] if word and isinstance(word, dict)]
+        
+        # 텍스트는 같은 단어 클러스터에서 재구성 (extract_text가 문자 클러스터링을 다시 수행하지 않도록)
+        text = self._words_to_text(words)
+        
+        # 테이블 감지
+        tables = page.extract_tables() or []
+        
+        return {
+            "page": page.page_number,
+            "source": "plumber",
+            "text": text,
+            # text/x0/x1/top/bottom은 extract_words가 항상 채우므로 직접 접근 (y0/y1은 제공되지 않아 0)
+            "bbox": [
+                {
+                    "text": word["text"],
+                    "x0": word["x0"],
+                    "y0": 0,
+                    "x1": word["x1"],
+                    "y1": 0,
+                    "top": word["top"],
+                    "bottom": word["bottom"]
+                }
+                for word in words
+            ],
+            "tables": [
+                {
+                    "rows": len(table),
+                    "cols": len(table[0]) if table else 0,
+                    "data": table
+                }
+                for table in tables
+            ] if tables else [],
+            "width": page.width,
+            "height": page.height
+        }
+    
+    def _words_to_text(self, words: List[Dict[str, Any]]) -> str:
+        """
+        extract_words 결과로 페이지 텍스트 구성
+        
+        extract_text와 같은 방식으로 top 값이 허용 오차 안에서 이어지는 단어들을 한 줄로 묶고,
+        줄은 위→아래, 줄 안의 단어는 왼쪽→오른쪽 순서로 배치한다.
+        """
+        if not words:
+            return ""
+        
+        tolerance = config.PDF_PLUMBER_LAYOUT_HEIGHT_TOLERANCE
+        lines: List[List[Dict[str, Any]]] = []
+        line: List[Dict[str, Any]] = []
+        line_top = None
+        for word in sorted(words, key=lambda w: w["top"]):
+            if line_top is not None and word["top"] - line_top > tolerance:
+                lines.append(line)
+                line = []
+            line.append(word)
+            line_top = word["top"]
+        lines.append(line)
+        
+        return "\n".join(
+            " ".join(word["text"] for word in sorted(line, key=lambda w: w["x0"]))
+            for line in lines
+        )
+    
     def get_version(self) -> str:
         """pdfplumber 버전 반환"""
         return pdfplumber.__version__
 
 
+_instance: Optional[PDFPlumberTool] = None
+
+
+def get_pdfplumber_tool() -> PDFPlumberTool:
+    """프로세스 공용 PDFPlumberTool 인스턴스 반환 (도구 상태는 파일과 무관하므로 재사용)"""
+    global _instance
+    if _instance is None:
+        _instance = PDFPlumberTool()
+    return _instance
+
+
 if __name__ == "__main__":
     # 테스트
     tool = PDFPlumberTool()
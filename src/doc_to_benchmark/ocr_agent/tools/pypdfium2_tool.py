@@ -10,10 +10,58 @@ except ImportError:
     PYPDFIUM2_AVAILABLE = False
     print("[WARNING] pypdfium2 not installed. Install with: pip install pypdfium2")
 
-from typing import Dict, List, Any, Union
+import io
+from typing import Dict, Iterable, List, Any, Optional, Union
 from pathlib import Path
 
 
+def count_pdf_pages(pdf_path: Union[str, Path]) -> Optional[int]:
+    """
+    PDF 페이지 수 반환 (페이지 트리만 읽으므로 전체 파싱 없이 빠름)
+    
+    Returns:
+        페이지 수 (pypdfium2 미설치 또는 PDF가 아니면 None)
+    """
+    if not PYPDFIUM2_AVAILABLE:
+        return None
+    
+    try:
+        pdf = pdfium.PdfDocument(str(pdf_path))
+    except Exception:
+        return None
+    try:
+        return len(pdf)
+    finally:
+        pdf.close()
+
+
+def build_page_subset(pdf_path: Union[str, Path], page_numbers: Iterable[int]) -> Optional[bytes]:
+    """
+    지정한 페이지(1부터 시작)만 담은 PDF 바이트 생성
+    
+    Returns:
+        PDF 바이트 (pypdfium2 미설치 또는 실패 시 None)
+    """
+    if not PYPDFIUM2_AVAILABLE:
+        return None
+    
+    try:
+        source = pdfium.PdfDocument(str(pdf_path))
+    except Exception:
+        return None
+    subset = pdfium.PdfDocument.new()
+    try:
+        subset.import_pages(source, [page_num - 1 for page_num in page_numbers])
+        buffer = io.BytesIO()
+        subset.save(buffer)
+        return buffer.getvalue()
+    except Exception:
+        return None
+    finally:
+        subset.close()
+        source.close()
+
+
 class PyPDFium2Tool:
     """PyPDFium2를 이용한 텍스트 추출"""
     
@@ -25,12 +73,17 @@ class PyPDFium2Tool:
         if not PYPDFIUM2_AVAILABLE:
             print("[WARNING] PyPDFium2Tool initialized but library not available")
     
-    def extract(self, pdf_path: Union[str, Path]) -> Dict[str, Any]:
+    def extract(
+        self,
+        pdf_path: Union[str, Path],
+        page_numbers: Optional[Iterable[int]] = None
+    ) -> Dict[str, Any]:
         """
         PDF 파일에서 텍스트 추출
         
         Args:
             pdf_path: PDF 파일 경로
+            page_numbers: 추출할 페이지 번호 (1부터 시작, None이면 전체)
             
         Returns:
             {
@@ -52,7 +105,12 @@ class PyPDFium2Tool:
             # PDF 열기
             pdf = pdfium.PdfDocument(str(pdf_path))
             
-            for page_num in range(len(pdf)):
+            if page_numbers is None:
+                page_indices = range(len(pdf))
+            else:
+                page_indices = [page_num - 1 for page_num in page_numbers if 0 < page_num <= len(pdf)]
+            
+            for page_num in page_indices:
                 page = pdf[page_num]
                 
                 # 텍스트 추출
@@ -6,7 +6,9 @@ Upstage OCR API를 사용한 텍스트 추출
 import requests
 import os
 from pathlib import Path
-from typing import Dict, List, Any, Union
+from typing import Dict, Iterable, List, Any, Optional, Union
+
+from .pypdfium2_tool import build_page_subset
 
 
 class UpstageOCRTool:
@@ -26,12 +28,20 @@ class UpstageOCRTool:
         """도구 버전 반환"""
         return "upstage-ocr-v1"
     
-    def extract(self, pdf_path: Union[str, Path]) -> Dict[str, Any]:
+    def extract(
+        self,
+        pdf_path: Union[str, Path],
+        page_numbers: Optional[Iterable[int]] = None,
+        api_key: Optional[str] = None
+    ) -> Dict[str, Any]:
         """
         Upstage OCR API로 PDF 추출
         
         Args:
             pdf_path: PDF 파일 경로
+            page_numbers: 추출할 페이지 번호 (1부터 시작, None이면 전체).
+                지정하면 해당 페이지만 담은 PDF를 전송하여 API 비용/시간 절감
+            api_key: Upstage API 키 (호출마다 전달, 도구 인스턴스에 저장하지 않음)
             
         Returns:
             {
@@ -54,25 +64,34 @@ class UpstageOCRTool:
             raise FileNotFoundError(f"PDF file not found: {pdf_path}")
         
         try:
-            # PDF 파일을 바이너리로 읽기
-            with open(pdf_path, 'rb') as f:
-                files = {"document": f}
-                headers = {"Authorization": f"Bearer {self.api_key}"}
-                
-                # API 호출
-                response = requests.post(
-                    self.api_url,
-                    headers=headers,
-                    files=files,
-                    timeout=120  # OCR은 시간이 걸릴 수 있음
-                )
-                
-                response.raise_for_status()
-                result = response.json()
+            # 샘플링된 페이지만 담은 PDF 생성 (실패 시 원본 전체 전송)
+            selected = sorted(set(page_numbers)) if page_numbers is not None else None
+            subset = build_page_subset(pdf_path, selected) if selected else None
+            content = subset if subset is not None else pdf_path.read_bytes()
+            
+            files = {"document": (pdf_path.name, content)}
+            headers = {"Authorization": f"Bearer {api_key}"}
+            
+            # API 호출
+            response = requests.post(
+                self.api_url,
+                headers=headers,
+                files=files,
+                timeout=120  # OCR은 시간이 걸릴 수 있음
+            )
+            
+            response.raise_for_status()
+            result = response.json()
             
             # 응답 파싱
             pages = self._parse_upstage_response(result)
             
+            # 부분 PDF의 페이지 번호(1..k)를 원본 페이지 번호로 복원
+            if subset is not None:
+                for page in pages:
+                    if 0 < page["page"] <= len(selected):
+                        page["page"] = selected[page["page"] - 1]
+            
             return {
                 "pages": pages,
                 "settings": {
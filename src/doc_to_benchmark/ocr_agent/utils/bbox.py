@@ -0,0 +1,41 @@
+"""
+bbox 유틸리티
+도구들이 반환하는 bbox 리스트(list of dict)를 좌표별 NumPy 배열(SoA)로 변환
+"""
+
+from operator import itemgetter
+from typing import Dict, List, Sequence
+
+import numpy as np
+
+# 레이아웃 분석에 주로 쓰는 좌표 필드
+BBOX_COORD_FIELDS = ("x0", "y0", "x1", "y1")
+
+
+def bbox_arrays(
+    bbox_list: List[Dict],
+    fields: Sequence[str] = BBOX_COORD_FIELDS
+) -> Dict[str, np.ndarray]:
+    """
+    bbox 리스트를 좌표별 연속 배열로 변환
+    
+    Args:
+        bbox_list: [{"x0": .., "y0": .., "x1": .., "y1": .., "text": ..}, ...]
+        fields: 추출할 좌표 필드 (없는 값은 0)
+        
+    Returns:
+        {"x0": ndarray[float64], "y0": ndarray[float64], ...}
+    """
+    count = len(bbox_list)
+    try:
+        # 모든 bbox에 필드가 있으면 itemgetter로 C 레벨에서 바로 꺼내 필드별 연속 배열 생성
+        return {
+            name: np.fromiter(map(itemgetter(name), bbox_list), dtype=np.float64, count=count)
+            for name in fields
+        }
+    except KeyError:
+        # 필드가 빠진 bbox가 있으면 기본값 0으로 채움
+        return {
+            name: np.fromiter((bbox.get(name, 0) for bbox in bbox_list), dtype=np.float64, count=count)
+            for name in fields
+        }
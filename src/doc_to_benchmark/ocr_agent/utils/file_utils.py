@@ -3,10 +3,59 @@
 """
 
 import json
+import os
+import shutil
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import Any, Dict, Iterator, List
 from datetime import datetime
 from .. import config
+from .json_utils import loads
+
+try:
+    import orjson
+except ImportError:  # orjson 미설치 시 표준 json 사용
+    orjson = None
+
+# JSONL 저장 시 파일 버퍼 크기
+JSONL_WRITE_BUFFER_SIZE = 1 << 20
+# 이 크기 이하의 JSONL은 한 번에 읽어서 분할, 초과하면 청크 단위로 스트리밍
+JSONL_SLURP_LIMIT = 64 << 20
+JSONL_READ_CHUNK_SIZE = 1 << 20
+
+
+def _dumps_line(data: Any) -> bytes:
+    """JSONL 한 줄을 UTF-8 바이트로 직렬화 (개행 포함)"""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_APPEND_NEWLINE)
+    return (json.dumps(data, ensure_ascii=False) + '\n').encode('utf-8')
+
+
+def _iter_jsonl_lines(path: Path) -> Iterator[bytes]:
+    """JSONL 파일을 줄(bytes) 단위로 순회"""
+    if path.stat().st_size <= JSONL_SLURP_LIMIT:
+        yield from path.read_bytes().split(b'\n')
+        return
+    
+    # 대용량 파일: 청크를 버퍼에 이어 붙이고(extend) 개행 위치로 잘라냄
+    buffer = bytearray()
+    with open(path, 'rb') as f:
+        while True:
+            chunk = f.read(JSONL_READ_CHUNK_SIZE)
+            if not chunk:
+                break
+            # 이전 버퍼 끝에는 개행이 없으므로 새로 붙인 구간부터 탐색
+            search_from = len(buffer)
+            buffer.extend(chunk)
+            start = 0
+            while True:
+                end = buffer.find(b'\n', search_from)
+                if end < 0:
+                    break
+                yield bytes(buffer[start:end])
+                start = search_from = end + 1
+            del buffer[:start]
+    if buffer:
+        yield bytes(buffer)
 
 
 def load_pages_text(jsonl_path: str) -> List[Dict]:
@@ -23,15 +72,14 @@ def load_pages_text(jsonl_path: str) -> List[Dict]:
     pages = []
     
     try:
-        with open(jsonl_path, 'r', encoding='utf-8') as f:
-            for line in f:
-                if line.strip():
-                    page = json.loads(line)
-                    pages.append(page)
+        for line in _iter_jsonl_lines(Path(jsonl_path)):
+            if line.strip():
+                page = loads(line)
+                pages.append(page)
     except FileNotFoundError:
         print(f"[ERROR] File not found: {jsonl_path}")
         return []
-    except json.JSONDecodeError as e:
+    except json.JSONDecodeError as e:  # orjson.JSONDecodeError도 이 예외의 하위 클래스
         print(f"[ERROR] JSON parsing error: {str(e)}")
         return []
     
@@ -50,9 +98,9 @@ def save_pages_text(pages: List[Dict], output_path: str) -> None:
     # 디렉토리 생성
     Path(output_path).parent.mkdir(parents=True, exist_ok=True)
     
-    with open(output_path, 'w', encoding='utf-8') as f:
-        for page in pages:
-            f.write(json.dumps(page, ensure_ascii=False) + '\n')
+    # 1MiB 버퍼에 모아서 한 번의 writelines로 기록 (제너레이터라 전체 직렬화 결과를 메모리에 쌓지 않음)
+    with open(output_path, 'wb', buffering=JSONL_WRITE_BUFFER_SIZE) as f:
+        f.writelines(_dumps_line(page) for page in pages)
 
 
 def save_error_log(state: Dict[str, Any]) -> None:
@@ -83,8 +131,8 @@ def save_error_log(state: Dict[str, Any]) -> None:
 
 def ensure_directories() -> None:
     """필요한 모든 디렉토리 생성"""
-    
-    directories = [
+    # 같은 경로가 여러 설정에 지정돼도 한 번만 생성
+    directories = frozenset([
         config.INPUT_DIR,
         config.OUTPUT_DIR,
         config.TEMP_DIR,
@@ -93,10 +141,10 @@ def ensure_directories() -> None:
         config.EXTRACTED_DIR,
         config.VALIDATED_DIR,
         config.JUDGED_DIR
-    ]
-    
-    for directory in directories:
-        directory.mkdir(parents=True, exist_ok=True)
+    ])
+    # 얕은 경로부터 생성하여 하위 디렉토리가 이미 만든 상위 경로를 다시 확인하지 않도록 함
+    for directory in sorted(directories, key=lambda d: len(Path(d).parts)):
+        os.makedirs(directory, exist_ok=True)
 
 
 def get_input_files(input_path: str = None) -> List[Path]:
@@ -122,9 +170,16 @@ def get_input_files(input_path: str = None) -> List[Path]:
         if path.suffix in config.SUPPORTED_FORMATS:
             files.append(path)
     elif path.is_dir():
-        # 디렉토리
-        for ext in config.SUPPORTED_FORMATS:
-            files.extend(path.glob(f"*{ext}"))
+        # 디렉토리 (한 번의 scandir로 모든 확장자 필터링, 숨김 파일은 glob과 동일하게 제외)
+        extensions = tuple(config.SUPPORTED_FORMATS)
+        with os.scandir(path) as entries:
+            files = [
+                Path(entry.path)
+                for entry in entries
+                if not entry.name.startswith('.')
+                and entry.name.endswith(extensions)
+                and entry.is_file()
+            ]
     
     return sorted(files)
 
@@ -144,21 +199,21 @@ def cleanup_temp_files(keep_latest: int = 5) -> None:
         if not temp_dir.exists():
             continue
         
-        # 하위 디렉토리들 (문서별)
-        subdirs = sorted(
-            [d for d in temp_dir.iterdir() if d.is_dir()],
-            key=lambda d: d.stat().st_mtime,
-            reverse=True
-        )
+        # 하위 디렉토리들 (문서별, scandir 항목의 캐시된 stat 사용)
+        with os.scandir(temp_dir) as entries:
+            subdirs = sorted(
+                [entry for entry in entries if entry.is_dir(follow_symlinks=False)],
+                key=lambda entry: entry.stat().st_mtime,
+                reverse=True
+            )
         
         # 오래된 것들 삭제
         for old_dir in subdirs[keep_latest:]:
             try:
-                import shutil
-                shutil.rmtree(old_dir)
-                print(f"[DELETE] Removed: {old_dir}")
+                shutil.rmtree(old_dir.path)
+                print(f"[DELETE] Removed: {old_dir.path}")
             except Exception as e:
-                print(f"[WARNING] Delete failed: {old_dir} - {str(e)}")
+                print(f"[WARNING] Delete failed: {old_dir.path} - {str(e)}")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,30 @@
+"""
+JSON 유틸리티
+orjson이 있으면 사용하고, LLM 응답의 코드블록 래핑을 벗겨냄
+"""
+
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:  # orjson 미설치 시 표준 json 사용
+    orjson = None
+
+
+def loads(data: Union[str, bytes]) -> Any:
+    """JSON 문자열/바이트 파싱 (orjson 우선)"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def strip_code_fence(text: str) -> str:
+    """마크다운 코드블록(```json ... ``` 또는 ``` ... ```)이 있으면 본문만 반환"""
+    _, sep, rest = text.partition("```json")
+    if not sep:
+        _, sep, rest = text.partition("```")
+    if not sep:
+        return text
+    body, _, _ = rest.partition("```")
+    return body.strip()
@@ -0,0 +1,89 @@
+"""
+LLM 응답 캐시
+동일한 요청(모델/프롬프트/파라미터)의 응답을 SQLite에 저장하여 재호출을 생략
+"""
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from .. import config
+
+
+class LLMResponseCache:
+    """요청 해시 → 응답 JSON을 저장하는 정확 일치(exact-match) 캐시"""
+
+    def __init__(self, path: Path, ttl_seconds: float):
+        self.path = Path(path)
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        self._connection: Optional[sqlite3.Connection] = None
+
+    @staticmethod
+    def make_key(payload: Dict[str, Any]) -> str:
+        """요청 페이로드의 sha256 해시 (키 순서와 무관)"""
+        canonical = json.dumps(payload, ensure_ascii=False, sort_keys=True)
+        return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._connection is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            connection = sqlite3.connect(self.path, timeout=30, check_same_thread=False)
+            # 여러 워커 프로세스가 동시에 읽고 쓸 수 있도록 WAL 사용
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                "key TEXT PRIMARY KEY, value TEXT NOT NULL, created_at REAL NOT NULL)"
+            )
+            self._connection = connection
+        return self._connection
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """캐시된 응답 반환 (없거나 만료되면 None)"""
+        try:
+            with self._lock:
+                row = self._connect().execute(
+                    "SELECT value, created_at FROM responses WHERE key = ?", (key,)
+                ).fetchone()
+        except sqlite3.Error as e:
+            print(f"[WARN] LLM cache read failed: {e}")
+            return None
+
+        if row is None:
+            return None
+        value, created_at = row
+        if time.time() - created_at > self.ttl_seconds:
+            return None
+        return json.loads(value)
+
+    def set(self, key: str, value: Dict[str, Any]) -> None:
+        """응답 저장 (실패해도 호출 흐름에는 영향 없음)"""
+        try:
+            with self._lock:
+                connection = self._connect()
+                connection.execute(
+                    "INSERT OR REPLACE INTO responses (key, value, created_at) VALUES (?, ?, ?)",
+                    (key, json.dumps(value, ensure_ascii=False), time.time())
+                )
+                connection.commit()
+        except sqlite3.Error as e:
+            print(f"[WARN] LLM cache write failed: {e}")
+
+
+_cache: Optional[LLMResponseCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_llm_cache() -> Optional[LLMResponseCache]:
+    """프로세스 공용 캐시 반환 (config.LLM_CACHE_ENABLED가 False면 None)"""
+    global _cache
+    if not config.LLM_CACHE_ENABLED:
+        return None
+    with _cache_lock:
+        if _cache is None:
+            _cache = LLMResponseCache(config.LLM_CACHE_PATH, config.LLM_CACHE_TTL_SECONDS)
+        return _cache
@@ -6,6 +6,7 @@ import requests
 import json
 from typing import Dict, Any, Optional
 from .. import config
+from .llm_cache import LLMResponseCache, get_llm_cache
 
 
 class SolarClient:
@@ -22,7 +23,8 @@ class SolarClient:
         prompt: str,
         system: Optional[str] = None,
         temperature: Optional[float] = None,
-        max_tokens: Optional[int] = None
+        max_tokens: Optional[int] = None,
+        api_key: Optional[str] = None
     ) -> Optional[Dict[str, Any]]:
         """
         Solar pro2 API 호출
@@ -32,6 +34,7 @@ class SolarClient:
             system: 시스템 프롬프트
             temperature: 온도 (기본값: config)
             max_tokens: 최대 토큰 (기본값: config)
+            api_key: 실행별 API 키 (클라이언트는 여러 문서가 공유하므로 호출마다 전달)
             
         Returns:
             {
@@ -46,7 +49,7 @@ class SolarClient:
         """
         
         headers = {
-            "Authorization": f"Bearer {config.get_api_key()}",
+            "Authorization": f"Bearer {api_key}",
             "Content-Type": "application/json"
         }
         
@@ -70,6 +73,14 @@ class SolarClient:
             "max_tokens": max_tokens or self.max_tokens
         }
         
+        # 동일 요청의 캐시된 응답이 있으면 API 호출 생략
+        cache = get_llm_cache()
+        cache_key = LLMResponseCache.make_key(payload) if cache is not None else None
+        if cache is not None:
+            cached = cache.get(cache_key)
+            if cached is not None:
+                return cached
+        
         try:
             response = requests.post(
                 f"{self.api_base}/chat/completions",
@@ -86,7 +97,7 @@ class SolarClient:
             choice = data["choices"][0]
             usage = data.get("usage", {})
             
-            return {
+            result = {
                 "content": choice["message"]["content"],
                 "usage": {
                     "input_tokens": usage.get("prompt_tokens", 0),
@@ -95,6 +106,9 @@ class SolarClient:
                 },
                 "model": data.get("model", self.model)
             }
+            if cache is not None:
+                cache.set(cache_key, result)
+            return result
             
         except requests.exceptions.RequestException as e:
             print(f"[ERROR] Solar API error: {str(e)}")
@@ -4,15 +4,107 @@
 """
 
 import re
-from typing import Dict, List, Any, Tuple
+from dataclasses import dataclass
+from typing import Dict, List, Any, Optional, Tuple
 from collections import Counter
+from itertools import groupby, islice
+
+import numpy as np
+
+from .bbox import bbox_arrays
+
+# 문장 분할: 마침표/물음표/느낌표 + 공백, 또는 개행
+_SENT_SPLIT_RE = re.compile(r'[.!?]+\s+|\n+')
+# 페이지 번호 라인 (예: "1", "페이지 5", "3/10", "- 2 -")
+_PAGENUM_RE = re.compile(r'^\d{1,3}$|^페이지\s*\d+$|^\d+\s*/\s*\d+$|^-\s*\d+\s*-$')
+# 종결 어미 (str.endswith에 튜플로 전달)
+_SENTENCE_ENDINGS = ('다', '요', '니다', '습니다', '음', '까', '네', '자', '.', '?', '!')
+# 반복 노이즈로 보는 동일 단어 연속 횟수
+_REPEAT_RUN = 5
+# 읽기 순서 역전으로 보지 않는 Y 오차 (px)
+_REVERSAL_TOLERANCE = 10
+
+
+class _SpecialCharTable(dict):
+    """
+    str.translate용 변환 테이블: 문자/숫자/공백은 삭제(None), 나머지(특수문자)는 유지
+    
+    처음 등장한 코드포인트만 판정해 캐시하므로 전체 유니코드 테이블을 미리 만들 필요가 없음
+    """
+    
+    def __missing__(self, codepoint: int):
+        char = chr(codepoint)
+        value = None if char.isalnum() or char.isspace() else codepoint
+        self[codepoint] = value
+        return value
+
+
+_SPECIAL_CHAR_TABLE = _SpecialCharTable()
+
+
+def _count_special_chars(text: str) -> int:
+    """문자/숫자/공백이 아닌 문자 수 (한 번의 C 레벨 translate로 계산)"""
+    return len(text.translate(_SPECIAL_CHAR_TABLE))
+
+
+def _find_repeated_word(words: List[str]) -> Optional[str]:
+    """동일 단어가 _REPEAT_RUN회 이상 연속된 첫 단어 (없으면 None)"""
+    for word, run in groupby(words):
+        if sum(1 for _ in islice(run, _REPEAT_RUN)) == _REPEAT_RUN:
+            return word
+    return None
+
+
+def _count_y_reversals(bbox_list: List[Dict]) -> int:
+    """
+    직전 bbox보다 위로 올라간(Y 역전) bbox 수
+    
+    직전 y0가 0보다 크고, 현재 y0가 직전보다 허용 오차 이상 작을 때 역전으로 센다.
+    """
+    ys = bbox_arrays(bbox_list, ("y0",))["y0"]
+    prev_y = ys[:-1]
+    return int(np.count_nonzero((prev_y > 0) & (ys[1:] < prev_y - _REVERSAL_TOLERANCE)))
+
+
+@dataclass(slots=True)
+class _SentStats:
+    """문장 완결성 판정 값 (간단 체크와 상세 체크가 공유)"""
+    text_length: int
+    sentence_count: int = 0
+    avg_length: float = 0.0
+    ending_ratio: float = 0.0
 
 
 class ValidationMetrics:
     """유효성 검증 메트릭 - 페이지별 Pass/Fail 판정"""
     
     def __init__(self):
-        pass
+        # 마지막으로 계산한 (결합 텍스트, 문장 통계) - 같은 텍스트로 다시 호출되면 재사용
+        self._sent_cache: Optional[Tuple[str, _SentStats]] = None
+    
+    def _sentence_stats(self, pages: List[Dict]) -> _SentStats:
+        """전체 텍스트 결합 + 문장 분할 결과 통계 (같은 텍스트에 대해 한 번만 계산)"""
+        # pages 객체가 같아도 내용이 바뀌었을 수 있으므로 결합 텍스트로 캐시 적중 여부 판단
+        full_text = " ".join([page.get("text", "") for page in pages]).strip()
+        cached = self._sent_cache
+        if cached is not None and cached[0] == full_text:
+            return cached[1]
+        
+        stats = _SentStats(text_length=len(full_text))
+        
+        # 텍스트가 충분히 길 때만 문장 분할
+        # 한국어: 마침표, 물음표, 느낌표 + 종결어미
+        if stats.text_length >= 50:
+            sentences = [s.strip() for s in _SENT_SPLIT_RE.split(full_text)]
+            sentences = [s for s in sentences if s]
+            if sentences:
+                stats.sentence_count = len(sentences)
+                stats.avg_length = sum(len(s) for s in sentences) / len(sentences)
+                ending_count = sum(1 for s in sentences if s.endswith(_SENTENCE_ENDINGS))
+                stats.ending_ratio = ending_count / len(sentences)
+        
+        self._sent_cache = (full_text, stats)
+        return stats
     
     def evaluate_reading_order(self, pages: List[Dict]) -> float:
         """
@@ -36,18 +128,8 @@ class ValidationMetrics:
                 # bbox가 너무 적으면 판단 불가 → Pass로 간주
                 continue
             
-            # Y 좌표 기준 역전 횟수 카운트
-            reversals = 0
-            prev_y = 0
-            
-            for bbox in bbox_list:
-                y = bbox.get("y0", 0)
-                
-                # 이전 요소보다 위에 있으면 역전 (10px 오차 허용)
-                if prev_y > 0 and y < prev_y - 10:
-                    reversals += 1
-                
-                prev_y = y
+            # Y 좌표 기준 역전 횟수 카운트 (이전 요소보다 위에 있으면 역전, 10px 오차 허용)
+            reversals = _count_y_reversals(bbox_list)
             
             # 역전 비율 계산
             reversal_ratio = reversals / len(bbox_list)
@@ -78,40 +160,25 @@ class ValidationMetrics:
             1.0 (Pass) or 0.0 (Fail)
         """
         
-        full_text = " ".join([page.get("text", "") for page in pages])
-        full_text = full_text.strip()
+        stats = self._sentence_stats(pages)
         
         # 1. 텍스트가 너무 짧으면 FAIL
-        if len(full_text) < 50:
+        if stats.text_length < 50:
             return 0.0
         
-        # 2. 문장 분할
-        # 한국어: 마침표, 물음표, 느낌표 + 종결어미
-        sentences = re.split(r'[.!?]+\s+|\n+', full_text)
-        sentences = [s.strip() for s in sentences if s.strip()]
-        
-        if len(sentences) == 0:
+        # 2. 문장 분할 결과가 없으면 FAIL
+        if stats.sentence_count == 0:
             return 0.0
         
         # 3. 평균 문장 길이 체크
-        avg_length = sum(len(s) for s in sentences) / len(sentences)
-        
-        if avg_length < 10:  # 너무 짧음 (단절)
+        if stats.avg_length < 10:  # 너무 짧음 (단절)
             return 0.0
         
-        if avg_length > 500:  # 너무 김 (병합)
+        if stats.avg_length > 500:  # 너무 김 (병합)
             return 0.0
         
-        # 4. 종결 어미 비율 체크
-        sentence_endings = ['다', '요', '니다', '습니다', '음', '까', '네', '자', '.', '?', '!']
-        ending_count = sum(
-            1 for s in sentences 
-            if any(s.endswith(e) for e in sentence_endings)
-        )
-        ending_ratio = ending_count / len(sentences)
-        
-        # 종결 어미 비율이 30% 미만이면 FAIL
-        if ending_ratio < 0.30:
+        # 4. 종결 어미 비율 체크 (30% 미만이면 FAIL)
+        if stats.ending_ratio < 0.30:
             return 0.0
         
         return 1.0
@@ -136,34 +203,22 @@ class ValidationMetrics:
         for page in pages:
             text = page.get("text", "")
             
-            if not text.strip():
-                continue
-            
-            lines = text.split("\n")
-            lines = [l.strip() for l in lines if l.strip()]
+            # 라인별 strip은 한 번만 (빈 텍스트/공백뿐인 페이지는 lines가 비어 건너뜀)
+            lines = [l for l in map(str.strip, text.split("\n")) if l]
             
             if len(lines) == 0:
                 continue
             
             # 1. 페이지 번호 패턴 감지
-            page_number_pattern = re.compile(
-                r'^\d{1,3}$|^페이지\s*\d+$|^\d+\s*/\s*\d+$|^-\s*\d+\s*-$'
-            )
-            
-            for line in lines:
-                if page_number_pattern.match(line):
-                    return 0.0  # 페이지 번호 발견 → FAIL
+            if any(map(_PAGENUM_RE.match, lines)):
+                return 0.0  # 페이지 번호 발견 → FAIL
             
             # 2. 동일 단어 연속 반복 감지
-            words = text.split()
-            if len(words) >= 5:
-                for i in range(len(words) - 4):
-                    # 5개 연속 단어가 모두 같으면
-                    if words[i] == words[i+1] == words[i+2] == words[i+3] == words[i+4]:
-                        return 0.0  # 반복 노이즈 → FAIL
+            if _find_repeated_word(text.split()) is not None:
+                return 0.0  # 반복 노이즈 → FAIL
             
             # 3. 특수문자 비율 체크
-            special_chars = sum(1 for c in text if not c.isalnum() and not c.isspace())
+            special_chars = _count_special_chars(text)
             total_chars = len(text)
             
             if total_chars > 0:
@@ -290,14 +345,7 @@ class ValidationMetrics:
         if len(bbox_list) < 2:
             return {'pass': True, 'reversal_ratio': 0.0, 'reason': 'Too few bboxes'}
         
-        reversals = 0
-        prev_y = 0
-        
-        for bbox in bbox_list:
-            y = bbox.get("y0", 0)
-            if prev_y > 0 and y < prev_y - 10:
-                reversals += 1
-            prev_y = y
+        reversals = _count_y_reversals(bbox_list)
         
         reversal_ratio = reversals / len(bbox_list)
         passed = reversal_ratio < 0.05
@@ -307,18 +355,16 @@ class ValidationMetrics:
     
     def _check_sentence_detailed(self, pages: List[Dict]) -> Dict:
         """문장 완결성 상세 체크"""
-        full_text = " ".join([page.get("text", "") for page in pages]).strip()
+        stats = self._sentence_stats(pages)
         
-        if len(full_text) < 50:
-            return {'pass': False, 'reason': f'Text too short ({len(full_text)} chars)'}
+        if stats.text_length < 50:
+            return {'pass': False, 'reason': f'Text too short ({stats.text_length} chars)'}
         
-        sentences = re.split(r'[.!?]+\s+|\n+', full_text)
-        sentences = [s.strip() for s in sentences if s.strip()]
-        
-        if not sentences:
+        if stats.sentence_count == 0:
             return {'pass': False, 'reason': 'No sentences found'}
         
-        avg_length = sum(len(s) for s in sentences) / len(sentences)
+        avg_length = stats.avg_length
+        ending_ratio = stats.ending_ratio
         
         if avg_length < 10:
             return {'pass': False, 'avg_length': avg_length, 'reason': 'Avg sentence too short'}
@@ -326,10 +372,6 @@ class ValidationMetrics:
         if avg_length > 500:
             return {'pass': False, 'avg_length': avg_length, 'reason': 'Avg sentence too long'}
         
-        sentence_endings = ['다', '요', '니다', '습니다', '음', '까', '네', '자', '.', '?', '!']
-        ending_count = sum(1 for s in sentences if any(s.endswith(e) for e in sentence_endings))
-        ending_ratio = ending_count / len(sentences)
-        
         if ending_ratio < 0.30:
             return {'pass': False, 'avg_length': avg_length, 'ending_ratio': ending_ratio, 
                     'reason': 'Low ending ratio'}
@@ -343,23 +385,20 @@ class ValidationMetrics:
             if not text:
                 continue
             
-            lines = [l.strip() for l in text.split("\n") if l.strip()]
+            lines = [l for l in map(str.strip, text.split("\n")) if l]
             
             # 페이지 번호
-            page_number_pattern = re.compile(r'^\d{1,3}$|^페이지\s*\d+$|^\d+\s*/\s*\d+$')
             for line in lines:
-                if page_number_pattern.match(line):
+                if _PAGENUM_RE.match(line):
                     return {'pass': False, 'reason': f'Page number found: "{line}"'}
             
             # 연속 반복
-            words = text.split()
-            if len(words) >= 5:
-                for i in range(len(words) - 4):
-                    if words[i] == words[i+1] == words[i+2] == words[i+3] == words[i+4]:
-                        return {'pass': False, 'reason': f'Repeated word: "{words[i]}"'}
+            repeated = _find_repeated_word(text.split())
+            if repeated is not None:
+                return {'pass': False, 'reason': f'Repeated word: "{repeated}"'}
             
             # 특수문자 비율
-            special_chars = sum(1 for c in text if not c.isalnum() and not c.isspace())
+            special_chars = _count_special_chars(text)
             special_ratio = special_chars / len(text) if len(text) > 0 else 0
             if special_ratio > 0.30:
                 return {'pass': False, 'reason': f'High special char ratio: {special_ratio*100:.1f}%'}
@@ -0,0 +1,37 @@
+"""
+입력 파일 프리페치
+배치 처리 시작 시 커널에 미리 읽기를 요청해 페이지 캐시를 데워둠
+"""
+
+import os
+from pathlib import Path
+from typing import Iterable, Union
+
+
+def prefetch_files(paths: Iterable[Union[str, Path]]) -> int:
+    """
+    각 파일에 posix_fadvise(WILLNEED)로 비동기 미리 읽기 요청
+    
+    커널이 백그라운드에서 읽어두므로 이후 PDF 파서의 open()/read()가 디스크를 기다리지 않음.
+    posix_fadvise를 지원하지 않는 플랫폼(Windows, macOS)에서는 아무것도 하지 않음.
+    
+    Returns:
+        미리 읽기를 요청한 파일 수
+    """
+    if not hasattr(os, "posix_fadvise"):
+        return 0
+    
+    requested = 0
+    for path in paths:
+        try:
+            fd = os.open(path, os.O_RDONLY)
+        except OSError:
+            continue
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+            requested += 1
+        except OSError:
+            pass
+        finally:
+            os.close(fd)
+    return requested
@@ -35,12 +35,11 @@ from .services.progress import OcrProgressReporter
 
 def _run_agent(
     document_path: Path,
-    agent_root: Path,
     progress: Optional[OcrProgressReporter] = None,
+    api_key: Optional[str] = None,
 ) -> DocumentState:
     """Synchronously execute the OCR agent and return the final state."""
 
-    agent_config.set_project_root(agent_root, ensure_directories=True)
     state = create_initial_document_state(str(document_path))
     if progress is None:
         progress_callback = None
@@ -60,8 +59,11 @@ def _run_agent(
             elif event == "stage_failed":
                 from_thread.run(_stage_failed, stage, description or "")
 
-    graph = create_processing_graph(progress_callback=progress_callback)
-    return graph.invoke(state)
+    graph = create_processing_graph()
+    # The key travels with this run only; the compiled graph, agents and tools are shared by
+    # every document being processed concurrently.
+    configurable = {"progress_callback": progress_callback, "api_key": api_key}
+    return graph.invoke(state, config={"configurable": configurable})
 
 
 async def process_document(
@@ -75,16 +77,15 @@ async def process_document(
 ) -> DocumentState:
     """Run the OCR pipeline with the provided API key and persist results."""
 
-    agent_root = storage.base_directory.parent / "ocr_agent"
-    if api_key:
-        agent_config.set_api_key(api_key)
-    try:
-        state = await to_thread.run_sync(_run_agent, file_path, agent_root, progress)
-        await _apply_state(session=session, document=document, state=state)
-        return state
-    finally:
-        if api_key:
-            agent_config.set_api_key(None)
+    # The agent's paths are process-wide. Switch them here on the event loop, never from the
+    # worker threads, and only when the root actually changes; every document of a storage
+    # shares it, so runs already in flight keep the same paths.
+    agent_root = (storage.base_directory.parent / "ocr_agent").resolve()
+    if agent_config.PROJECT_ROOT != agent_root:
+        agent_config.set_project_root(agent_root, ensure_directories=True)
+    state = await to_thread.run_sync(_run_agent, file_path, progress, api_key)
+    await _apply_state(session=session, document=document, state=state)
+    return state
 
 
 async def _apply_state(*, session: AsyncSession, document: Document, state: DocumentState) -> None:
@@ -245,7 +246,8 @@ async def _replace_page_results(
                 document_id=document.id,
                 document_page_id=page_obj.id,
                 page_number=page_judge.page_num,
-                provider=strategy,
+                # Stored trimmed so the API's SQL and Python aggregations can compare raw values.
+                provider=strategy.strip(),
                 text_content=page_text,
                 validity=_validation_flag(page_validation),
                 llm_judge_score=float(page_judge.S_total),
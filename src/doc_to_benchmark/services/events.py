@@ -2,21 +2,37 @@ from __future__ import annotations
 
 import asyncio
 import json
+from collections import deque
 from contextlib import asynccontextmanager
-from dataclasses import dataclass
+from contextvars import ContextVar
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any, AsyncIterator, Dict, Optional, Set
+from typing import Any, AsyncIterator, Deque, Dict, Optional, Tuple
 
+try:
+    import orjson
+except ImportError:  # fall back to the stdlib encoder when orjson is unavailable
+    orjson = None
 
-def _json_dumps(data: Dict[str, Any]) -> str:
-    """Serialize payloads to JSON using ISO timestamps where possible."""
 
-    def default_serializer(obj: Any) -> Any:
-        if isinstance(obj, datetime):
-            return obj.isoformat()
-        raise TypeError(f"type {type(obj)!r} is not JSON serializable")
+def _default_serializer(obj: Any) -> Any:
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    raise TypeError(f"type {type(obj)!r} is not JSON serializable")
 
-    return json.dumps(data, default=default_serializer)
+
+# The encoder is chosen once at import so serializing an event is a single direct call.
+if orjson is not None:
+
+    def _json_dumps(data: Dict[str, Any]) -> str:
+        """Serialize payloads to JSON; orjson emits datetimes as ISO 8601 natively."""
+        return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS).decode()
+
+else:
+
+    def _json_dumps(data: Dict[str, Any]) -> str:
+        """Serialize payloads to JSON using ISO timestamps where possible."""
+        return json.dumps(data, default=_default_serializer)
 
 
 @dataclass(slots=True)
@@ -25,76 +41,170 @@ class SseEvent:
 
     event: str
     data: Dict[str, Any]
+    _message: Optional[Dict[str, str]] = field(default=None, init=False, repr=False, compare=False)
 
     def as_message(self) -> Dict[str, str]:
-        """Return a dict compatible with Starlette's EventSourceResponse."""
-        return {"event": self.event, "data": _json_dumps(self.data)}
+        """Return a dict compatible with Starlette's EventSourceResponse.
+
+        The payload is serialized on first use and the same message is shared by
+        every subscriber the event is fanned out to.
+        """
+        if self._message is None:
+            self._message = {"event": self.event, "data": _json_dumps(self.data)}
+        return self._message
+
+
+class _SseChannel:
+    """Bounded per-subscriber buffer; appending to a full buffer drops the oldest event."""
+
+    __slots__ = ("events", "ready")
+
+    def __init__(self, size: int) -> None:
+        # A size of 0 means unbounded, as with asyncio.Queue.
+        self.events: Deque[SseEvent] = deque(maxlen=size or None)
+        self.ready = asyncio.Event()
+
+
+class _EventBatch:
+    """Events held back by :meth:`SseBroker.batch` until the block exits."""
+
+    __slots__ = ("events", "open")
+
+    def __init__(self) -> None:
+        self.events: list[Tuple[SseEvent, Optional[str]]] = []
+        self.open = True
 
 
 class SseBroker:
     """In-process pub/sub broker for SSE streaming."""
 
-    def __init__(self, *, queue_size: int = 64) -> None:
+    def __init__(self, *, queue_size: int = 256) -> None:
         self._queue_size = queue_size
-        self._all_subscribers: Set[asyncio.Queue[SseEvent]] = set()
-        self._document_subscribers: Dict[str, Set[asyncio.Queue[SseEvent]]] = {}
+        # Subscriber collections are immutable tuples replaced on (un)registration, so
+        # publish can read a consistent snapshot without taking the lock.
+        self._all_subscribers: Tuple[_SseChannel, ...] = ()
+        self._document_subscribers: Dict[str, Tuple[_SseChannel, ...]] = {}
+        self._high_watermarks: Dict[_SseChannel, int] = {}
+        self._dropped_events = 0
         self._lock = asyncio.Lock()
+        self._batch: ContextVar[Optional[_EventBatch]] = ContextVar("sse_event_batch", default=None)
+
+    @property
+    def dropped_events(self) -> int:
+        """Number of events discarded because a subscriber buffer was full."""
+        return self._dropped_events
+
+    def high_watermarks(self) -> list[int]:
+        """Return the peak buffer depth observed for each active subscriber."""
+        return list(self._high_watermarks.values())
 
     async def publish(self, event: SseEvent, *, document_id: Optional[str] = None) -> None:
         """Publish `event` to global listeners and optionally document-specific listeners."""
 
-        async with self._lock:
-            recipients: Set[asyncio.Queue[SseEvent]] = set(self._all_subscribers)
-            if document_id is not None:
-                recipients.update(self._document_subscribers.get(document_id, set()))
+        pending = self._batch.get()
+        if pending is not None and pending.open:
+            pending.events.append((event, document_id))
+            return
+        self._deliver(event, document_id)
 
-        await asyncio.gather(*(self._send(queue, event) for queue in recipients))
+    @asynccontextmanager
+    async def batch(self) -> AsyncIterator[None]:
+        """Hold back events published by the current task and deliver them together on exit.
+
+        Subscribers then receive the whole burst on a single wake-up instead of one per event.
+        Publishes from other tasks are unaffected.
+        """
+        pending = _EventBatch()
+        token = self._batch.set(pending)
+        try:
+            yield
+        finally:
+            self._batch.reset(token)
+            # Tasks spawned inside the block inherit the context; publish directly from now on.
+            pending.open = False
+            for event, document_id in pending.events:
+                self._deliver(event, document_id)
+
+    def _deliver(self, event: SseEvent, document_id: Optional[str]) -> None:
+        # Each subscription owns its channel, so the two snapshots never overlap and can be
+        # walked as they are, without merging them into a new collection.
+        global_recipients = self._all_subscribers
+        document_recipients = (
+            self._document_subscribers.get(document_id, ()) if document_id is not None else ()
+        )
+
+        if not global_recipients and not document_recipients:
+            return
+
+        # Serialize once up front; every subscriber stream reuses the cached message.
+        event.as_message()
+
+        # Appending never blocks, so a stalled client cannot hold up the publisher.
+        for channel in global_recipients:
+            self._send(channel, event)
+        for channel in document_recipients:
+            self._send(channel, event)
 
     async def subscribe_all(self) -> AsyncIterator[SseEvent]:
         """Subscribe to all document events."""
-        queue = asyncio.Queue[SseEvent](maxsize=self._queue_size)
-        async with self._register(queue, bucket=self._all_subscribers):
-            while True:
-                event = await queue.get()
+        channel = _SseChannel(self._queue_size)
+        async with self._register(channel):
+            async for event in self._drain(channel):
                 yield event
 
     async def subscribe_document(self, document_id: str) -> AsyncIterator[SseEvent]:
         """Subscribe to events for a single document."""
 
-        queue = asyncio.Queue[SseEvent](maxsize=self._queue_size)
-        async with self._register(queue, bucket=self._document_bucket(document_id)):
-            while True:
-                event = await queue.get()
+        channel = _SseChannel(self._queue_size)
+        async with self._register(channel, document_id=document_id):
+            async for event in self._drain(channel):
                 yield event
 
-    async def _send(self, queue: asyncio.Queue[SseEvent], event: SseEvent) -> None:
-        try:
-            queue.put_nowait(event)
-        except asyncio.QueueFull:
-            try:
-                queue.get_nowait()
-            except asyncio.QueueEmpty:
-                pass
-            queue.put_nowait(event)
+    @staticmethod
+    async def _drain(channel: _SseChannel) -> AsyncIterator[SseEvent]:
+        events = channel.events
+        while True:
+            await channel.ready.wait()
+            # Clear before draining so an event appended while we yield re-arms the flag.
+            channel.ready.clear()
+            while events:
+                yield events.popleft()
+
+    def _send(self, channel: _SseChannel, event: SseEvent) -> None:
+        events = channel.events
+        if len(events) == events.maxlen:
+            self._dropped_events += 1
+        events.append(event)
+        channel.ready.set()
+        depth = len(events)
+        if depth > self._high_watermarks.get(channel, 0):
+            self._high_watermarks[channel] = depth
 
     @asynccontextmanager
     async def _register(
         self,
-        queue: asyncio.Queue[SseEvent],
+        channel: _SseChannel,
         *,
-        bucket: Set[asyncio.Queue[SseEvent]],
+        document_id: Optional[str] = None,
     ) -> AsyncIterator[None]:
         async with self._lock:
-            bucket.add(queue)
+            if document_id is None:
+                self._all_subscribers = (*self._all_subscribers, channel)
+            else:
+                bucket = self._document_subscribers.get(document_id, ())
+                self._document_subscribers[document_id] = (*bucket, channel)
         try:
             yield
         finally:
             async with self._lock:
-                bucket.discard(queue)
-
-    def _document_bucket(self, document_id: str) -> Set[asyncio.Queue[SseEvent]]:
-        bucket = self._document_subscribers.get(document_id)
-        if bucket is None:
-            bucket = set()
-            self._document_subscribers[document_id] = bucket
-        return bucket
+                if document_id is None:
+                    self._all_subscribers = tuple(c for c in self._all_subscribers if c is not channel)
+                else:
+                    bucket = tuple(
+                        c for c in self._document_subscribers.get(document_id, ()) if c is not channel
+                    )
+                    if bucket:
+                        self._document_subscribers[document_id] = bucket
+                    else:
+                        self._document_subscribers.pop(document_id, None)
+                self._high_watermarks.pop(channel, None)
@@ -1,14 +1,20 @@
 from __future__ import annotations
 
 import asyncio
-from typing import Dict, Optional
+from contextlib import asynccontextmanager
+from functools import lru_cache
+from typing import AsyncIterator, Dict, Optional, Tuple
 
-from sqlalchemy import select
+from sqlalchemy import select, update
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
 from ..models import AgentStatus, Document, ReportAgentStatus
 from .events import SseBroker, SseEvent
 
+# Progress events raised within this window are coalesced into a single SSE publish.
+PROGRESS_PUBLISH_DELAY = 0.05
+
 STAGE_ORDER = ["uploaded", "extraction", "validation", "judge", "report"]
 STAGE_TO_NODES = {
     "uploaded": ["n1"],
@@ -19,9 +25,12 @@ STAGE_TO_NODES = {
 }
 
 
-def _build_mermaid_chart(stage_states: Dict[str, str]) -> str:
-    """Render a mermaid chart that highlights stage progression."""
-    lines = [
+# Wire value of each agent status, looked up instead of going through Enum.value.
+_AGENT_STATUS_VALUES: Dict[AgentStatus, str] = {status: status.value for status in AgentStatus}
+
+# Node, edge and class definitions shared by every chart; only the class assignments vary.
+_MERMAID_PREFIX = "\n".join(
+    [
         "flowchart TD",
         "  n1([Document Upload]):::base",
         "  n2([Format Detection]):::base",
@@ -47,18 +56,36 @@ def _build_mermaid_chart(stage_states: Dict[str, str]) -> str:
         "  classDef completed fill:#e8f5e9,stroke:#81c784,color:#1b5e20;",
         "  classDef failed fill:#ffebee,stroke:#ef5350,color:#b71c1c;",
     ]
-    for stage, nodes in STAGE_TO_NODES.items():
-        status = stage_states.get(stage, "pending")
-        css = "pending"
-        if status in ("running", "completed", "failed"):
-            css = status
-        for node in nodes:
-            lines.append(f"  class {node} {css};")
-    return "\n".join(lines)
+)
+
+
+# (stage position, node) for every charted node, flattened once from STAGE_TO_NODES.
+_STAGE_NODE_PAIRS: Tuple[Tuple[int, str], ...] = tuple(
+    (index, node) for index, nodes in enumerate(STAGE_TO_NODES.values()) for node in nodes
+)
+# Stage states that have their own chart class; anything else renders as pending.
+_CHART_STATES = frozenset(("running", "completed", "failed"))
+
+
+def _build_mermaid_chart(stage_states: Dict[str, str]) -> str:
+    """Render a mermaid chart that highlights stage progression."""
+    # Only the charted stages affect the output, so key the cache on their states alone.
+    return _render_mermaid_chart(tuple(stage_states.get(stage, "pending") for stage in STAGE_TO_NODES))
+
+
+@lru_cache(maxsize=64)
+def _render_mermaid_chart(states: Tuple[str, ...]) -> str:
+    css = [status if status in _CHART_STATES else "pending" for status in states]
+    class_lines = [f"  class {node} {css[index]};" for index, node in _STAGE_NODE_PAIRS]
+    return _MERMAID_PREFIX + "\n" + "\n".join(class_lines)
 
 
 class OcrProgressReporter:
-    """Coordinate OCR progress updates across SSE and database."""
+    """Coordinate OCR progress updates across SSE and database.
+
+    Used as an async context manager, the reporter keeps one session for its whole
+    lifetime and commits once per transition; otherwise each transition opens its own.
+    """
 
     def __init__(
         self,
@@ -73,11 +100,28 @@ class OcrProgressReporter:
         self._stage_states: Dict[str, str] = {stage: "pending" for stage in STAGE_ORDER}
         self._lock = asyncio.Lock()
         self._mermaid_chart: str | None = None
+        # Agent status payload keyed by agent name; loaded from the database once and
+        # then kept in step with the writes this reporter makes.
+        self._agents: Optional[Dict[str, dict]] = None
+        self._pending_agents: list[dict] = []
+        self._publish_task: Optional[asyncio.Task[None]] = None
+        self._session: Optional[AsyncSession] = None
+        # (stages, agents, chart) of the last published event, to skip identical re-publishes.
+        self._published: Optional[Tuple[Dict[str, str], list[dict], Optional[str]]] = None
+
+    async def __aenter__(self) -> OcrProgressReporter:
+        self._session = self._session_factory()
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        session, self._session = self._session, None
+        if session is not None:
+            await session.close()
 
     async def initialize(self, initial_status: str) -> None:
-        self._stage_states["uploaded"] = "completed" if initial_status != "uploaded" else "running"
-        await self._persist_mermaid()
-        await self._publish_progress()
+        async with self._lock:
+            self._stage_states["uploaded"] = "completed" if initial_status != "uploaded" else "running"
+            await self._sync()
 
     async def stage_started(self, stage: str) -> None:
         async with self._lock:
@@ -85,23 +129,17 @@ class OcrProgressReporter:
             self._stage_states[stage] = "running"
             if stage != "uploaded" and self._stage_states.get("uploaded") == "running":
                 self._stage_states["uploaded"] = "completed"
-            await self._update_agent_status(stage, AgentStatus.RUNNING)
-            await self._persist_mermaid()
-            await self._publish_progress()
+            await self._sync(stage, AgentStatus.RUNNING)
 
     async def stage_completed(self, stage: str, *, description: Optional[str] = None) -> None:
         async with self._lock:
             self._stage_states[stage] = "completed"
-            await self._update_agent_status(stage, AgentStatus.COMPLETED, description=description)
-            await self._persist_mermaid()
-            await self._publish_progress()
+            await self._sync(stage, AgentStatus.COMPLETED, description=description)
 
     async def stage_failed(self, stage: str, *, error: str) -> None:
         async with self._lock:
             self._stage_states[stage] = "failed"
-            await self._update_agent_status(stage, AgentStatus.FAILED, description=error)
-            await self._persist_mermaid()
-            await self._publish_progress()
+            await self._sync(stage, AgentStatus.FAILED, description=error)
 
     async def finalize(self, document_status: str) -> None:
         async with self._lock:
@@ -109,67 +147,126 @@ class OcrProgressReporter:
                 self._stage_states["report"] = "completed"
             elif document_status == "error":
                 self._stage_states["report"] = "failed"
-            await self._persist_mermaid()
+            # The pipeline rewrites every agent status when it stores its result, so reload them.
+            self._agents = None
+            await self._sync(flush=True)
+
+    async def _sync(
+        self,
+        stage: Optional[str] = None,
+        agent_status: Optional[AgentStatus] = None,
+        *,
+        description: Optional[str] = None,
+        flush: bool = False,
+    ) -> None:
+        """Persist the current state in a single transaction, then publish it.
+
+        Publishing is deferred by ``PROGRESS_PUBLISH_DELAY`` so that bursts of
+        transitions reach subscribers as one event; ``flush`` publishes immediately.
+        """
+        async with self._transaction() as session:
+            if stage is not None and agent_status is not None:
+                await self._update_agent_status(session, stage, agent_status, description=description)
+            await self._persist_mermaid(session)
+            agents = await self._collect_agent_payload(session)
+            await session.commit()
+        self._pending_agents = agents
+        if flush:
+            if self._publish_task is not None:
+                self._publish_task.cancel()
+                self._publish_task = None
             await self._publish_progress()
+        elif self._publish_task is None:
+            self._publish_task = asyncio.create_task(self._publish_after(PROGRESS_PUBLISH_DELAY))
+
+    @asynccontextmanager
+    async def _transaction(self) -> AsyncIterator[AsyncSession]:
+        if self._session is None:
+            async with self._session_factory() as session:
+                yield session
+            return
+        try:
+            yield self._session
+        except BaseException:
+            await self._session.rollback()
+            raise
+
+    async def _publish_after(self, delay: float) -> None:
+        await asyncio.sleep(delay)
+        self._publish_task = None
+        await self._publish_progress()
 
     async def _update_agent_status(
         self,
+        session: AsyncSession,
         stage: str,
         agent_status: AgentStatus,
         *,
         description: Optional[str] = None,
     ) -> None:
-        async with self._session_factory() as session:
-            record = await session.scalar(
-                select(ReportAgentStatus).where(
-                    ReportAgentStatus.document_id == self._document_id,
-                    ReportAgentStatus.agent_name == stage,
-                )
+        # One statement instead of select-then-insert/update (unique on document_id, agent_name).
+        statement = sqlite_insert(ReportAgentStatus).values(
+            document_id=self._document_id,
+            agent_name=stage,
+            status=agent_status,
+            description=description,
+        )
+        await session.execute(
+            statement.on_conflict_do_update(
+                index_elements=[ReportAgentStatus.document_id, ReportAgentStatus.agent_name],
+                set_={
+                    "status": statement.excluded.status,
+                    "description": statement.excluded.description,
+                },
             )
-            if record is None:
-                record = ReportAgentStatus(
-                    document_id=self._document_id,
-                    agent_name=stage,
-                    status=agent_status,
-                    description=description,
-                )
-                session.add(record)
-            else:
-                record.status = agent_status
-                record.description = description
-            await session.commit()
+        )
+        if self._agents is not None:
+            self._agents[stage] = {
+                "agent": stage,
+                "status": _AGENT_STATUS_VALUES[agent_status],
+                "description": description,
+            }
 
-    async def _persist_mermaid(self) -> None:
+    async def _persist_mermaid(self, session: AsyncSession) -> None:
         chart = _build_mermaid_chart(self._stage_states)
+        if chart == self._mermaid_chart:
+            # The transition did not change the rendered chart; nothing to store.
+            return
         self._mermaid_chart = chart
-        async with self._session_factory() as session:
-            document = await session.get(Document, self._document_id)
-            if document is None:
-                return
-            document.mermaid_chart = chart
-            await session.commit()
+        # A bulk UPDATE leaves the long-lived session's identity map alone and is a no-op
+        # if the document has been deleted meanwhile.
+        await session.execute(
+            update(Document).where(Document.id == self._document_id).values(mermaid_chart=chart)
+        )
 
-    async def _collect_agent_payload(self) -> list[dict]:
-        async with self._session_factory() as session:
+    async def _collect_agent_payload(self, session: AsyncSession) -> list[dict]:
+        if self._agents is None:
+            # Autoflush makes the status written earlier in this session visible here;
+            # populate_existing refreshes rows the pipeline rewrote from another session.
             result = await session.execute(
-                select(ReportAgentStatus).where(ReportAgentStatus.document_id == self._document_id)
+                select(ReportAgentStatus)
+                .where(ReportAgentStatus.document_id == self._document_id)
+                .execution_options(populate_existing=True)
             )
-            statuses = []
+            self._agents = {}
             for record in result.scalars().all():
-                statuses.append(
-                    {
-                        "agent": record.agent_name,
-                        "status": record.status.value,
-                        "description": record.description,
-                    }
-                )
-            return statuses
+                self._agents[record.agent_name] = {
+                    "agent": record.agent_name,
+                    "status": _AGENT_STATUS_VALUES[record.status],
+                    "description": record.description,
+                }
+        return list(self._agents.values())
 
     async def _publish_progress(self) -> None:
+        snapshot = (dict(self._stage_states), self._pending_agents, self._mermaid_chart)
+        if snapshot == self._published:
+            return
+        self._published = snapshot
+        # Publish the copy: the broker serializes lazily, after later stage updates may have run.
         payload = {
             "documentId": self._document_id,
-            "stages": self._stage_states,
-            "agents": await self._collect_agent_payload(),
+            "stages": snapshot[0],
+            "agents": self._pending_agents,
             "mermaid": self._mermaid_chart,
         }
         await self._broker.publish(
@@ -1,8 +1,10 @@
 from __future__ import annotations
+import logging
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Optional
 
+import anyio
 from anyio.abc import ObjectReceiveStream
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
@@ -13,6 +15,10 @@ from .events import SseBroker, SseEvent
 from .progress import OcrProgressReporter
 from .status import document_status_to_stream_label
 
+MAX_CONCURRENT_TASKS = 4
+
+logger = logging.getLogger(__name__)
+
 
 @dataclass(slots=True)
 class OcrTask:
@@ -31,17 +37,29 @@ class OcrBackgroundWorker:
         session_factory: async_sessionmaker[AsyncSession],
         storage: UploadStorage,
         broker: SseBroker,
+        max_concurrency: int = MAX_CONCURRENT_TASKS,
     ) -> None:
         self._tasks = tasks
         self._session_factory = session_factory
         self._storage = storage
         self._broker = broker
+        self._limiter = anyio.CapacityLimiter(max(1, max_concurrency))
 
     async def run(self) -> None:
         """Continuously process OCR tasks until the receive stream closes."""
-        async with self._tasks:
+        # One long-lived task group: each task starts as soon as it is received and the
+        # limiter, not batch boundaries, decides how many run at once.
+        async with self._tasks, anyio.create_task_group() as group:
             async for task in self._tasks:
+                group.start_soon(self._run_limited, task)
+
+    async def _run_limited(self, task: OcrTask) -> None:
+        async with self._limiter:
+            try:
                 await self._handle_task(task)
+            except Exception:  # noqa: BLE001
+                # A failing task must not cancel the other running tasks.
+                logger.exception("OCR task failed for document %s", task.document_id)
 
     async def _handle_task(self, task: OcrTask) -> None:
         async with self._session_factory() as session:
@@ -60,73 +78,89 @@ class OcrBackgroundWorker:
                 )
                 return
 
-            progress = OcrProgressReporter(
+            async with OcrProgressReporter(
                 document_id=document.id,
                 session_factory=self._session_factory,
                 broker=self._broker,
-            )
-            await progress.initialize(document_status_to_stream_label(document.status))
+            ) as progress:
+                await progress.initialize(document_status_to_stream_label(document.status))
 
-            await self._start_processing(session, document)
+                await self._start_processing(session, document)
 
-            file_path = self._storage.base_directory / task.stored_name
-            try:
-                await process_document(
-                    document=document,
-                    file_path=file_path,
-                    storage=self._storage,
-                    session=session,
-                    api_key=task.api_key,
-                    progress=progress,
-                )
-                await session.commit()
-                await session.refresh(document)
-                await progress.finalize(document_status_to_stream_label(document.status))
-                await self._publish_status(document)
-            except Exception as exc:  # noqa: BLE001
-                await session.rollback()
-                document = await session.get(Document, task.document_id)
-                if document is None:
-                    await self._broker.publish(
-                        SseEvent(
-                            event="document-status",
-                            data={
-                                "documentId": task.document_id,
-                                "status": "error",
-                                "message": str(exc),
-                            },
-                        ),
-                        document_id=task.document_id,
+                file_path = self._storage.base_directory / task.stored_name
+                try:
+                    await process_document(
+                        document=document,
+                        file_path=file_path,
+                        storage=self._storage,
+                        session=session,
+                        api_key=task.api_key,
+                        progress=progress,
                     )
-                    return
-
-                document.status = DocumentStatus.FAILED
-                document.selection_rationale = f"OCR 처리 실패: {exc}"
-                document.processed_at = datetime.utcnow()
-                document.recommended_strategy = None
-                document.recommendation_notes = None
-                document.selected_strategy = None
-                document.quality_score = None
-                document.ocr_speed_ms_per_page = None
-                await session.commit()
-                await session.refresh(document)
-                await progress.finalize("error")
-                await self._publish_status(document, message=str(exc))
+                    await session.commit()
+                    await session.refresh(document)
+                    status_label = document_status_to_stream_label(document.status)
+                    # Deliver the final progress and status events to subscribers together.
+                    async with self._broker.batch():
+                        await progress.finalize(status_label)
+                        await self._publish_status(document, status_label=status_label)
+                except Exception as exc:  # noqa: BLE001
+                    await session.rollback()
+                    document = await session.get(Document, task.document_id)
+                    if document is None:
+                        await self._broker.publish(
+                            SseEvent(
+                                event="document-status",
+                                data={
+                                    "documentId": task.document_id,
+                                    "status": "error",
+                                    "message": str(exc),
+                                },
+                            ),
+                            document_id=task.document_id,
+                        )
+                        return
+
+                    document.status = DocumentStatus.FAILED
+                    document.selection_rationale = f"OCR 처리 실패: {exc}"
+                    # Naive UTC like the other timestamp columns, without the deprecated utcnow().
+                    document.processed_at = datetime.now(timezone.utc).replace(tzinfo=None)
+                    document.recommended_strategy = None
+                    document.recommendation_notes = None
+                    document.selected_strategy = None
+                    document.quality_score = None
+                    document.ocr_speed_ms_per_page = None
+                    await session.commit()
+                    await session.refresh(document)
+                    async with self._broker.batch():
+                        await progress.finalize("error")
+                        await self._publish_status(document, message=str(exc))
 
     async def _start_processing(self, session: AsyncSession, document: Document) -> None:
         if document.status != DocumentStatus.PROCESSING:
             document.status = DocumentStatus.PROCESSING
-            await session.commit()
-            await session.refresh(document)
+        # Always end the transaction opened by the initial load, and skip the refresh that
+        # would open a new one: the session then holds no pooled connection while the OCR
+        # run (which can take minutes) executes. The loaded attributes stay valid because
+        # the session factory sets expire_on_commit=False.
+        await session.commit()
         await self._publish_status(document)
 
-    async def _publish_status(self, document: Document, *, message: str | None = None) -> None:
+    async def _publish_status(
+        self,
+        document: Document,
+        *,
+        message: str | None = None,
+        status_label: str | None = None,
+    ) -> None:
+        if status_label is None:
+            status_label = document_status_to_stream_label(document.status)
         await self._broker.publish(
             SseEvent(
                 event="document-status",
                 data={
                     "documentId": document.id,
-                    "status": document_status_to_stream_label(document.status),
+                    "status": status_label,
                     "uploadedAt": document.uploaded_at,
                     "processedAt": document.processed_at,
                     "pagesCount": document.pages_count,